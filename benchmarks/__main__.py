@@ -0,0 +1,43 @@
+import argparse
+
+from benchmarks.bench import BENCHMARKS, run, write_results
+from benchmarks.corpus import CorpusConfig, PRESETS, write_corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='pyfbx serializer benchmarks')
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='small')
+    parser.add_argument('--objects', type=int)
+    parser.add_argument('--depth', type=int)
+    parser.add_argument('--properties', type=int)
+    parser.add_argument('--array-length', type=int)
+    parser.add_argument('--entropy', type=float)
+    parser.add_argument('--uncompressed', action='store_true')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', choices=sorted(BENCHMARKS), action='append')
+    parser.add_argument('--output', help='JSON results path, printed to stdout when omitted')
+    parser.add_argument('--corpus', help='Write the synthetic files to this directory instead of benchmarking')
+    parser.add_argument('--count', type=int, default=1, help='Number of files to write with --corpus')
+
+    args = parser.parse_args(argv)
+
+    overrides = {name: getattr(args, name) for name in ('objects', 'depth', 'properties', 'array_length', 'entropy',
+                                                         'seed') if getattr(args, name) is not None}
+
+    if args.uncompressed:
+        overrides['compressed'] = False
+
+    config = CorpusConfig(**{**PRESETS[args.preset].to_json(), **overrides})
+
+    if args.corpus:
+        for path in write_corpus(args.corpus, config, args.count):
+            print(path)
+
+        return
+
+    write_results(run(config, args.repeat, args.only, args.preset), args.output)
+
+
+if __name__ == '__main__':
+    main()
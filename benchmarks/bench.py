@@ -0,0 +1,147 @@
+import datetime
+import gc
+import io
+import json
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+
+import numpy
+
+from pyfbx import loader, FBXFile, FBXNode, DoubleArray, FBXArrayEncoding
+from pyfbx.serializers import FBXFileSerializer, FBXNodeSerializer, ListSerializer
+
+from benchmarks.corpus import CorpusConfig, generate, array_values
+
+
+def measure(operation, repeat: int):
+    # Timings are taken without tracemalloc running, peak memory from one extra traced run
+    timings = []
+
+    for _ in range(repeat):
+        gc.collect()
+
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return timings, peak
+
+
+def result(serializer: str, operation: str, size: int, timings: list, peak: int, **extra):
+    best = min(timings)
+
+    return {
+        'serializer': serializer,
+        'operation': operation,
+        'bytes': size,
+        'repeat': len(timings),
+        'min_seconds': best,
+        'median_seconds': statistics.median(timings),
+        'mb_per_second': size / best / (1 << 20) if best else None,
+        'peak_memory_bytes': peak,
+        **extra
+    }
+
+
+def bench_file(config: CorpusConfig, repeat: int):
+    file = generate(config)
+    serializer = loader.get_serializer(FBXFile)
+    serialized = loader.serialize(file)
+
+    results = []
+
+    timings, peak = measure(lambda: serializer.serialize(loader, file), repeat)
+    results.append(result(FBXFileSerializer.__name__, 'serialize', len(serialized), timings, peak))
+
+    timings, peak = measure(lambda: serializer.deserialize(loader, FBXFile, io.BytesIO(serialized)), repeat)
+    results.append(result(FBXFileSerializer.__name__, 'deserialize', len(serialized), timings, peak))
+
+    return results
+
+
+def bench_node(config: CorpusConfig, repeat: int):
+    # The Objects section on its own, without the file header and the other top level sections
+    objects = generate(config).objects
+    serializer = loader.get_serializer(FBXNode)
+    serialized = loader.serialize(objects)
+
+    results = []
+
+    timings, peak = measure(lambda: serializer.serialize(loader, objects), repeat)
+    results.append(result(FBXNodeSerializer.__name__, 'serialize', len(serialized), timings, peak))
+
+    timings, peak = measure(lambda: serializer.deserialize(loader, FBXNode, io.BytesIO(serialized)), repeat)
+    results.append(result(FBXNodeSerializer.__name__, 'deserialize', len(serialized), timings, peak))
+
+    return results
+
+
+def bench_list(config: CorpusConfig, repeat: int):
+    serializer = loader.get_serializer(DoubleArray)
+    values = array_values(config.array_length * 64, config.entropy, random.Random(config.seed))
+
+    results = []
+
+    for encoding in FBXArrayEncoding:
+        array = DoubleArray(*values, encoding=encoding)
+        serialized = serializer.serialize(loader, array)
+
+        timings, peak = measure(lambda: serializer.serialize(loader, array), repeat)
+        results.append(result(ListSerializer.__name__, 'serialize', len(serialized), timings, peak,
+                              encoding=encoding.name, elements=len(array)))
+
+        for use_numpy in (False, True):
+            timings, peak = measure(
+                lambda: serializer.deserialize(loader, DoubleArray, io.BytesIO(serialized), use_numpy=use_numpy),
+                repeat)
+            results.append(result(ListSerializer.__name__, 'deserialize', len(serialized), timings, peak,
+                                  encoding=encoding.name, elements=len(array), use_numpy=use_numpy))
+
+    return results
+
+
+BENCHMARKS = {
+    'file': bench_file,
+    'node': bench_node,
+    'list': bench_list,
+}
+
+
+def run(config: CorpusConfig, repeat: int = 5, benchmarks=None, preset: str = None):
+    results = []
+
+    for name in benchmarks or BENCHMARKS:
+        results.extend(BENCHMARKS[name](config, repeat))
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'numpy': numpy.__version__,
+        'preset': preset,
+        'config': config.to_json(),
+        'results': results,
+    }
+
+
+def write_results(results: dict, path: str = None):
+    serialized = json.dumps(results, indent=2)
+
+    if path is None:
+        print(serialized)
+    else:
+        with open(path, 'w') as file:
+            file.write(serialized)
@@ -0,0 +1,121 @@
+import os
+import random
+
+from pyfbx import loader, FBXFile, FBXNode, FBXHeaderExtension, GlobalSettings, Definitions, ObjectType, Objects, \
+    Connections, PropertyTemplate, Properties70, Property70, DoubleArray, IntArray, FBXArrayEncoding, long, double
+
+
+class CorpusConfig(object):
+    # objects: number of Model/Geometry pairs, depth: nested child nodes under each model, properties: Property70
+    # entries per Properties70 block, array_length: elements per geometry array, entropy: 0 gives highly compressible
+    # arrays, 1 gives random (nearly incompressible) ones
+    def __init__(self, objects: int = 100, depth: int = 2, properties: int = 8, array_length: int = 1024,
+                 entropy: float = 0.5, compressed: bool = True, seed: int = 0):
+        self.objects = objects
+        self.depth = depth
+        self.properties = properties
+        self.array_length = array_length
+        self.entropy = entropy
+        self.compressed = compressed
+        self.seed = seed
+
+    def to_json(self):
+        return dict(self.__dict__)
+
+
+PRESETS = {
+    'small': CorpusConfig(objects=50, depth=2, properties=8, array_length=256),
+    'medium': CorpusConfig(objects=500, depth=3, properties=16, array_length=2048),
+    'large': CorpusConfig(objects=2000, depth=4, properties=32, array_length=8192),
+}
+
+
+def node(name: str, *values, cls=FBXNode):
+    fbx_node = cls()
+    fbx_node._name = name
+    fbx_node._value = list(values)
+
+    return fbx_node
+
+
+def properties70(count: int, rng: random.Random):
+    return Properties70(*[
+        Property70(f"Property{i}", "double", "Number", "A", double(rng.random())) if i % 2 else
+        Property70(f"Property{i}", "Vector3D", "Vector", "", double(rng.random()), double(rng.random()),
+                   double(rng.random()))
+        for i in range(count)
+    ])
+
+
+def array_values(length: int, entropy: float, rng: random.Random):
+    pattern = [double(i % 16) for i in range(16)]
+
+    return [double(rng.random()) if rng.random() < entropy else pattern[i % 16] for i in range(length)]
+
+
+def generate(config: CorpusConfig) -> FBXFile:
+    rng = random.Random(config.seed)
+    encoding = FBXArrayEncoding.COMPRESSED if config.compressed else FBXArrayEncoding.UNCOMPRESSED
+
+    file = FBXFile()
+
+    file.fbx_header_extension = node("FBXHeaderExtension", cls=FBXHeaderExtension)
+    file.fbx_header_extension.fbx_version = node("FBXVersion", 7400)
+    file.fbx_header_extension.creator = node("Creator", "pyfbx benchmarks")
+
+    file.global_settings = node("GlobalSettings", cls=GlobalSettings)
+    file.global_settings.version = node("Version", 1000)
+    file.global_settings.properties70 = properties70(config.properties, rng)
+
+    object_type = node("ObjectType", "Model", cls=ObjectType)
+    object_type.property_template = PropertyTemplate("FbxNode", properties70(config.properties, rng))
+
+    file.definitions = node("Definitions", cls=Definitions)
+    file.definitions.append(object_type)
+
+    file.objects = node("Objects", cls=Objects)
+    file.connections = node("Connections", cls=Connections)
+
+    for i in range(config.objects):
+        geometry_uid, model_uid = long(10_000_000 + i), long(20_000_000 + i)
+
+        geometry = node("Geometry", geometry_uid, f"Mesh{i}\x00\x01Geometry", "Mesh")
+        geometry.vertices = node("Vertices", DoubleArray(*array_values(config.array_length, config.entropy, rng),
+                                                         encoding=encoding))
+        geometry.polygon_vertex_index = node("PolygonVertexIndex", IntArray(
+            *[j if j % 3 != 2 else -j - 1 for j in range(config.array_length // 3)], encoding=encoding))
+
+        model = node("Model", model_uid, f"Model{i}\x00\x01Model", "Mesh")
+        model.version = node("Version", 232)
+        model.properties70 = properties70(config.properties, rng)
+
+        parent = model
+        for level in range(config.depth):
+            child = node(f"Level{level}", level, f"Nested {level}")
+            setattr(parent, f"level{level}", child)
+            parent = child
+
+        file.objects.append(geometry)
+        file.objects.append(model)
+
+        file.connections.append(node("C", "OO", geometry_uid, model_uid))
+        file.connections.append(node("C", "OO", model_uid, long(0)))
+
+    return file
+
+
+def write_corpus(directory: str, config: CorpusConfig, count: int = 1):
+    os.makedirs(directory, exist_ok=True)
+
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"synthetic_{i}.fbx")
+
+        file_config = CorpusConfig(**{**config.to_json(), 'seed': config.seed + i})
+
+        with open(path, 'wb') as stream:
+            stream.write(loader.serialize(generate(file_config)))
+
+        paths.append(path)
+
+    return paths
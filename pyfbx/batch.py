@@ -0,0 +1,154 @@
+import concurrent.futures
+import glob
+import os
+import signal
+import time
+import traceback
+import warnings
+
+from pyfbx.exceptions import FBXException
+
+
+class FBXBatchResult(object):
+    __slots__ = ('path', 'value', 'error', 'elapsed')
+
+    def __init__(self, path: str, value=None, error: str = None, elapsed: float = 0.0):
+        self.path = path
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        state = "ok" if self.ok else self.error.strip().splitlines()[-1]
+
+        return f"<{self.__class__.__name__} {self.path} ({state}, {self.elapsed:.3f}s)>"
+
+
+class FBXBatchTimeout(FBXException):
+    pass
+
+
+def expand_paths(paths, pattern: str = '**/*.fbx'):
+    # A directory is searched recursively for pattern, any other string is treated as a glob
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    for path in paths:
+        path = os.fspath(path)
+
+        if os.path.isdir(path):
+            yield from sorted(glob.glob(os.path.join(path, pattern), recursive=True))
+        elif glob.has_magic(path):
+            yield from sorted(glob.glob(path, recursive=True))
+        else:
+            yield path
+
+
+def _timeout(signum, frame):
+    raise FBXBatchTimeout("Timed out parsing file")
+
+
+def load_file(path: str, mapper=None, timeout: float = None, **kwargs) -> FBXBatchResult:
+    # Runs in the worker processes, errors are captured into the result rather than raised
+    from pyfbx import loader, FBXFile
+
+    start = time.perf_counter()
+    alarm = timeout is not None and timeouts_supported(timeout)
+    value = error = None
+
+    if alarm:
+        previous = signal.signal(signal.SIGALRM, _timeout)
+
+    try:
+        try:
+            if alarm:
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+
+            file = loader.read(path, FBXFile, **kwargs)
+            value = mapper(file) if mapper is not None else file
+        finally:
+            # Disarmed before anything else, an alarm firing in between is still caught below as this file's error
+            if alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except (Exception, FBXException):  # FBXException derives from BaseException, so Exception alone misses it
+        error = traceback.format_exc()
+    finally:
+        if alarm:
+            signal.signal(signal.SIGALRM, signal.SIG_DFL if previous is None else previous)
+
+    return FBXBatchResult(path, value, error, elapsed=time.perf_counter() - start)
+
+
+def timeouts_supported(timeout: float) -> bool:
+    if hasattr(signal, 'setitimer'):
+        return True
+
+    warnings.warn(f"Ignoring the {timeout}s batch timeout, SIGALRM is not available on this platform", RuntimeWarning,
+                  stacklevel=3)
+
+    return False
+
+
+def load_batch(paths, workers: int = None, timeout: float = None, mapper=None, pattern: str = '**/*.fbx', **kwargs):
+    # Parses files across a process pool and yields an FBXBatchResult per file in completion order. mapper must be
+    # picklable (e.g. a module level function), it runs in the worker so only its return value is sent back. Timeouts
+    # are enforced inside the workers where SIGALRM is available. A worker dying (e.g. a segfault or being OOM killed)
+    # fails the files in flight at the time and the pool is restarted for the rest of the batch.
+    workers = workers or os.cpu_count() or 1
+    paths = iter(expand_paths(paths, pattern))
+
+    if timeout is not None and not timeouts_supported(timeout):
+        timeout = None
+
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+
+    # Only a few files per worker are in flight at once, so huge batches are not all queued up front
+    pending = {}
+
+    def submit(count):
+        for path in paths:
+            pending[executor.submit(load_file, path, mapper, timeout, **kwargs)] = path
+
+            count -= 1
+
+            if count <= 0:
+                break
+
+    try:
+        submit(workers * 4)
+
+        while pending:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            broken = False
+
+            for future in done:
+                path = pending.pop(future)
+
+                try:
+                    yield future.result()
+                except concurrent.futures.process.BrokenProcessPool:
+                    broken = True
+                    yield FBXBatchResult(path, error=traceback.format_exc())
+                except (Exception, FBXException):
+                    # e.g. a result that could not be pickled back from the worker
+                    yield FBXBatchResult(path, error=traceback.format_exc())
+
+            if broken:
+                # The broken pool fails everything still queued on it, there is no telling which file killed it
+                for future, path in list(pending.items()):
+                    yield FBXBatchResult(path, error=f"Worker process terminated while {path} was in flight")
+
+                pending.clear()
+
+                executor.shutdown(wait=False)
+                executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+
+                submit(workers * 4)
+            else:
+                submit(len(done))
+    finally:
+        executor.shutdown(wait=True)
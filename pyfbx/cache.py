@@ -0,0 +1,216 @@
+import collections
+import hashlib
+import hmac
+import os
+import pickle
+import threading
+
+from pyfbx.core import FBXFile
+from pyfbx.exceptions import FBXSerializationException
+
+
+# Opt-in snapshot cache around loader.read(path, FBXFile). Parsed trees are pickled with their arrays as raw buffers
+# and kept both in a bounded in-memory LRU and in a size bounded directory, least recently used snapshots are evicted
+# first. Entries are keyed on the source file's size and mtime, or on a hash of its contents with key='content'.
+# Snapshots on disk are signed with an HMAC and only unpickled once verified. Without a secret a random key is generated
+# the first time a directory is used and kept in it, readable by its owner only, so runs sharing the directory reuse
+# it. Caches shared between machines, or that should not keep their key next to the snapshots, need a secret passed in.
+class FBXParseCache(object):
+    SNAPSHOT_VERSION = 2
+    SNAPSHOT_EXTENSION = '.fbxsnap'
+    SECRET_FILE = 'secret.key'
+
+    # Only these read options change the parsed tree, anything else (metrics, tracer, worker counts) is not keyed on
+    PARSE_OPTIONS = ('compact', 'include', 'exclude', 'use_numpy', 'defer_arrays')
+
+    def __init__(self, loader, directory: str, max_disk_bytes: int = 1 << 30, max_memory_bytes: int = 256 << 20,
+                 key: str = 'stat', secret: bytes = None):
+        if key not in ('stat', 'content'):
+            raise FBXSerializationException(f"Unknown parse cache key {key}, expected 'stat' or 'content'", key)
+
+        if secret is not None and not isinstance(secret, (bytes, bytearray)):
+            raise FBXSerializationException("Parse cache secret must be bytes", secret)
+
+        self.loader = loader
+        self.directory = str(directory)
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.key = key
+
+        self.memory = collections.OrderedDict()
+        self.memory_bytes = 0
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.secret = bytes(secret) if secret is not None else directory_secret(self.directory, self.SECRET_FILE)
+
+    def read(self, path: str, **kwargs) -> FBXFile:
+        # Snapshots always hold the full tree, lazy nodes cannot outlive the stream they were read from
+        kwargs.pop('lazy', None)
+
+        key = self.cache_key(path, **kwargs)
+        snapshot = self.get(key)
+
+        with self.lock:
+            if snapshot is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if snapshot is not None:
+            return pickle.loads(snapshot)
+
+        file = self.loader.read(str(path), FBXFile, **kwargs)
+        self.put(key, pickle.dumps(file, protocol=pickle.HIGHEST_PROTOCOL))
+
+        return file
+
+    def cache_key(self, path: str, **kwargs) -> str:
+        digest = hashlib.sha256()
+
+        options = [(name, kwargs[name]) for name in self.PARSE_OPTIONS if kwargs.get(name) is not None]
+        digest.update(f"{self.SNAPSHOT_VERSION}:{options!r}".encode('utf-8'))
+
+        if self.key == 'content':
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1 << 20), b''):
+                    digest.update(chunk)
+        else:
+            stat = os.stat(path)
+            digest.update(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def snapshot_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SNAPSHOT_EXTENSION)
+
+    def sign(self, key: str, snapshot: bytes) -> bytes:
+        # The cache key is signed along with the snapshot, so a valid snapshot cannot be renamed over another entry
+        return hmac.new(self.secret, key.encode('ascii') + snapshot, hashlib.sha256).digest()
+
+    def verify(self, key: str, signed: bytes):
+        signature, snapshot = signed[:hashlib.sha256().digest_size], signed[hashlib.sha256().digest_size:]
+
+        return snapshot if hmac.compare_digest(signature, self.sign(key, snapshot)) else None
+
+    def get(self, key: str):
+        with self.lock:
+            snapshot = self.memory.get(key)
+
+            if snapshot is not None:
+                self.memory.move_to_end(key)
+
+                return snapshot
+
+        path = self.snapshot_path(key)
+
+        try:
+            with open(path, 'rb') as file:
+                snapshot = self.verify(key, file.read())
+
+            if snapshot is None:
+                # Written with another secret, or tampered with, either way it is re-parsed and overwritten
+                return None
+
+            os.utime(path)  # Snapshots are evicted from disk by modification time
+        except OSError:
+            return None
+
+        self.remember(key, snapshot)
+
+        return snapshot
+
+    def put(self, key: str, snapshot: bytes):
+        self.remember(key, snapshot)
+
+        if len(snapshot) > self.max_disk_bytes:
+            return
+
+        path = self.snapshot_path(key)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with open(temporary, 'wb') as file:
+            file.write(self.sign(key, snapshot))
+            file.write(snapshot)
+
+        os.replace(temporary, path)
+
+        self.evict_disk()
+
+    def remember(self, key: str, snapshot: bytes):
+        if len(snapshot) > self.max_memory_bytes:
+            return
+
+        with self.lock:
+            previous = self.memory.pop(key, None)
+
+            if previous is not None:
+                self.memory_bytes -= len(previous)
+
+            self.memory[key] = snapshot
+            self.memory_bytes += len(snapshot)
+
+            while self.memory_bytes > self.max_memory_bytes:
+                _, evicted = self.memory.popitem(last=False)
+                self.memory_bytes -= len(evicted)
+
+    def evict_disk(self):
+        snapshots = []
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SNAPSHOT_EXTENSION):
+                stat = entry.stat()
+                snapshots.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in snapshots)
+
+        for _, size, path in sorted(snapshots):
+            if total <= self.max_disk_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            total -= size
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+            self.memory_bytes = 0
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SNAPSHOT_EXTENSION):
+                os.remove(entry.path)
+
+
+def directory_secret(directory: str, name: str) -> bytes:
+    path = os.path.join(directory, name)
+
+    try:
+        with open(path, 'rb') as file:
+            return file.read()
+    except FileNotFoundError:
+        pass
+
+    # Written in full to a private temporary file and hard linked into place, linking fails rather than replacing the
+    # key if another process created it first
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    with os.fdopen(os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as file:
+        file.write(os.urandom(32))
+
+    try:
+        os.link(temporary, path)
+    except FileExistsError:
+        pass
+    finally:
+        os.remove(temporary)
+
+    with open(path, 'rb') as file:
+        return file.read()
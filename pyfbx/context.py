@@ -0,0 +1,194 @@
+import enum
+import threading
+
+import pybran
+
+from pybran.loaders import Loader
+
+from pyfbx.core import *
+from pyfbx.serializers import PrimitiveSerializer, EnumSerializer, StringSerializer, BytesSerializer, ListSerializer, \
+    FBXFileSerializer, FBXNodeSerializer, FBXCompactNodeSerializer, resolve_property_decoders
+
+
+def type_id_generator(k):
+    return k.__name__
+
+
+def field_name_generator(k):
+    return k.__name__ if k is type else type(k).__name__
+
+
+def class_definition_generator(cls):
+    return pybran.ClassDefinition(cls, fields_registry=pybran.Registry(field_name_generator))
+
+
+_registry_lock = threading.RLock()
+_registries_configured = False
+
+
+def configure_registries():
+    # pybran's registries are process wide, they are reset and filled with the FBX type codes once, the first time a
+    # context is created rather than when pyfbx is imported
+    global _registries_configured
+
+    with _registry_lock:
+        if _registries_configured:
+            return
+
+        pybran.type_registry.default_value_generator = type_id_generator
+        pybran.class_registry.default_value_generator = class_definition_generator
+
+        pybran.type_registry.clear()
+        pybran.refresh()
+
+        pybran.type_registry.add(int, b'I')
+        pybran.type_registry.add(short, b'Y')
+        pybran.type_registry.add(double, b'D')
+        pybran.type_registry.add(float, b'F')
+        pybran.type_registry.add(long, b'L')
+        pybran.type_registry.add(str, b'S')
+        pybran.type_registry.add(bytes, b'R')
+        pybran.type_registry.add(bool, b'C')
+
+        pybran.type_registry.add(IntArray, b'i')
+        pybran.type_registry.add(LongArray, b'l')
+        pybran.type_registry.add(FloatArray, b'f')
+        pybran.type_registry.add(DoubleArray, b'd')
+        pybran.type_registry.add(BoolArray, b'b')
+
+        pybran.type_registry.add(Property70, 'P')
+
+        _registries_configured = True
+
+
+def default_serializers() -> dict:
+    return {
+        int: PrimitiveSerializer,
+        long: PrimitiveSerializer,
+        short: PrimitiveSerializer,
+        char: PrimitiveSerializer,
+        bool: PrimitiveSerializer,
+        float: PrimitiveSerializer,
+        double: PrimitiveSerializer,
+        enum.IntEnum: EnumSerializer,
+
+        str: StringSerializer,
+        bytes: BytesSerializer,
+        list: ListSerializer,
+
+        FBXArrayEncoding: EnumSerializer,
+        FBXArray: ListSerializer,
+        IntArray: ListSerializer,
+        LongArray: ListSerializer,
+        FloatArray: ListSerializer,
+        DoubleArray: ListSerializer,
+        BoolArray: ListSerializer,
+
+        FBXFile: FBXFileSerializer,
+
+        FBXNode: FBXNodeSerializer,
+        FBXLazyNode: FBXNodeSerializer,
+        FBXCompactNode: FBXCompactNodeSerializer,
+        FBXHeaderExtension: FBXNodeSerializer,
+        CreationTimeStamp: FBXNodeSerializer,
+        GlobalSettings: FBXNodeSerializer,
+        Connection: FBXNodeSerializer,
+        Connections: FBXNodeSerializer,
+        Takes: FBXNodeSerializer,
+        PropertyTemplate: FBXNodeSerializer,
+        Definitions: FBXNodeSerializer,
+        ObjectType: FBXNodeSerializer,
+        FBXDocumentInfo: FBXNodeSerializer,
+        Document: FBXNodeSerializer,
+        Documents: FBXNodeSerializer,
+        Objects: FBXNodeSerializer,
+        Property70: FBXNodeSerializer,
+        Properties70: FBXNodeSerializer,
+        MetaData: FBXNodeSerializer,
+        References: FBXNodeSerializer,
+        Object: FBXNodeSerializer,
+    }
+
+
+def array_views(serializers: dict) -> dict:
+    # Wrapped and deferred arrays are instances of their array type's view subclass, serialized like the array type
+    return {cls.__view__: serializer for cls, serializer in serializers.items()
+            if isinstance(cls, type) and issubclass(cls, FBXArray) and cls.__view__ is not cls}
+
+
+# Caches the property decoder table resolved from its serializers, registering a serializer resolves it again
+class FBXLoader(Loader):
+    def __init__(self, serializer_registry: dict = None):
+        super().__init__(serializer_registry)
+
+        self.serializer_registry.update(array_views(self.serializer_registry))
+        self._property_decoders = None
+
+    @property
+    def property_decoders(self) -> dict:
+        if self._property_decoders is None:
+            self._property_decoders = resolve_property_decoders(self)
+
+        return self._property_decoders
+
+    def write(self, path: str, obj, **kwargs):
+        # Nodes and files are streamed to the file through their serializer's write(), rather than serialized in
+        # memory first. Unlike pybran's Loader.write the file does not need to exist yet.
+        serializer = self.get_serializer(type(obj))
+
+        with open(path, 'wb') as stream:
+            if isinstance(serializer, FBXNodeSerializer):
+                serializer.write(self, obj, stream, **kwargs)
+            else:
+                stream.write(self.serialize(obj, **kwargs))
+
+    def register(self, cls: type, serializer: type):
+        super().register(cls, serializer)
+
+        for view, view_serializer in array_views({cls: serializer}).items():
+            super().register(view, view_serializer)
+
+        self._property_decoders = None
+
+
+# Owns a Loader and its serializer mapping. Creating one configures the pybran registries, so nothing is registered
+# until a context (or the default pyfbx.loader) is first used. Extra or overriding serializers can be passed in.
+class FBXContext(object):
+    def __init__(self, serializers: dict = None):
+        configure_registries()
+
+        self.serializers = default_serializers()
+
+        if serializers is not None:
+            self.serializers.update(serializers)
+
+        self.loader = FBXLoader(self.serializers)
+
+    def register(self, cls: type, serializer: type):
+        self.loader.register(cls, serializer)
+
+    def read(self, path: str, cls: type = FBXFile, **kwargs):
+        return self.loader.read(str(path), cls, **kwargs)
+
+    def serialize(self, obj, **kwargs) -> bytes:
+        return self.loader.serialize(obj, **kwargs)
+
+    def write(self, path: str, obj, **kwargs):
+        self.loader.write(str(path), obj, **kwargs)
+
+    def deserialize(self, data, cls: type = FBXFile, **kwargs):
+        return self.loader.deserialize(data, cls, **kwargs)
+
+
+_default_context = None
+
+
+def default_context() -> FBXContext:
+    global _default_context
+
+    if _default_context is None:
+        with _registry_lock:
+            if _default_context is None:
+                _default_context = FBXContext()
+
+    return _default_context
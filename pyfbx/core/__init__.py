@@ -1,8 +1,12 @@
 from pybran.decorators import schema, field
 
+from .events import *
 from .header import *
 from .common import *
 from .objects import *
+from .lazy import *
+from .compact import *
+from .graph import *
 
 
 @schema
@@ -67,7 +71,21 @@ class References(FBXNode, list):
 
 @schema
 class Connections(FBXNode, list):
-    pass
+    def graph(self) -> FBXConnectionGraph:
+        # Built on first use and dropped whenever the list is modified
+        graph = self.__dict__.get('_graph')
+
+        if graph is None:
+            graph = self.__dict__['_graph'] = FBXConnectionGraph.from_node(self)
+
+        return graph
+
+    def _invalidate(self):
+        self.__dict__.pop('_graph', None)
+
+
+for _method in LIST_MUTATORS:
+    setattr(Connections, _method, invalidating(_method))
 
 
 @schema
@@ -1,4 +1,5 @@
 import enum
+import sys
 from datetime import datetime
 
 import numpy
@@ -158,7 +159,8 @@ class FBXObject(FBXEmitter):
         super().__setattr__(name, value)
 
         if isinstance(value, FBXObject):
-            self.__children__.add(name)
+            # Schema subclasses do not always chain up to __init__, so the child set may not exist yet
+            self.__dict__.setdefault('__children__', set()).add(name)
 
     def __delattr__(self, name):
         super().__delattr__(name)
@@ -234,39 +236,413 @@ class FBXArray(list):
         super().__init__(values)
 
     __subtype__: type = None
+    __dtype__: numpy.dtype = None
+
+    # Every array type has a view subclass (see FBXArrayView) that wrapped and deferred arrays are created as, so plain
+    # arrays keep list's native slots. __array_type__ is the array type itself on both.
+    __array_type__: type = None
+    __view__: type = None
+
+    wrapped = False
+    deferred = False
+    decoded = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if '__array_type__' not in cls.__dict__:
+            array_view(cls)
+
+    @classmethod
+    def wrap(cls, ndarray: numpy.ndarray, encoding: FBXArrayEncoding = FBXArrayEncoding.UNCOMPRESSED):
+        array = cls.__view__(encoding=encoding)
+        array._ndarray = ndarray
+
+        return array
+
+    @classmethod
+    def defer(cls, handle, encoding: FBXArrayEncoding = FBXArrayEncoding.UNCOMPRESSED):
+        array = cls.__view__(encoding=encoding)
+        array._handle = handle
+
+        return array
+
+    def release(self) -> bool:
+        return False
+
+    def numpy(self) -> numpy.ndarray:
+        return numpy.fromiter(list.__iter__(self), dtype=self.__dtype__, count=list.__len__(self))
+
+    def _materialize(self):
+        pass
+
+    def __reduce_ex__(self, protocol):
+        if self.__dtype__ is None:
+            return super().__reduce_ex__(protocol)
+
+        # Pickled as the raw little endian payload rather than item by item
+        return _restore_array, (self.__array_type__, self.encoding, self.numpy().tobytes(), self.wrapped)
+
+
+def _restore_array(cls, encoding: FBXArrayEncoding, payload: bytes, wrapped: bool):
+    array = cls.wrap(numpy.frombuffer(payload, dtype=cls.__dtype__), encoding)
+
+    if not wrapped:
+        array._materialize()
+
+    return array
+
+
+# Mixed into the view subclass of every array type. The values are held by a numpy.ndarray instead of as list items,
+# deferred arrays decode their payload from the file on first access. The first mutation converts the values to list
+# items and turns the array back into its plain array type.
+class FBXArrayView(object):
+    # Set for deferred arrays, locates the still encoded payload in the file, see pyfbx.core.lazy.FBXArrayHandle
+    _handle = None
+
+    @property
+    def _ndarray(self) -> numpy.ndarray:
+        ndarray = self.__dict__.get('_decoded')
+
+        if ndarray is None and self._handle is not None:
+            ndarray = self.__dict__['_decoded'] = self._handle.decode()
+
+        return ndarray
+
+    @_ndarray.setter
+    def _ndarray(self, ndarray: numpy.ndarray):
+        self.__dict__['_decoded'] = ndarray
+
+    @property
+    def wrapped(self):
+        return self._handle is not None or self.__dict__.get('_decoded') is not None
+
+    @property
+    def deferred(self):
+        return self._handle is not None
+
+    @property
+    def decoded(self):
+        return self._handle is None or self.__dict__.get('_decoded') is not None
+
+    def release(self) -> bool:
+        # Drops the decoded payload of a deferred array, it is decoded again when next accessed
+        if self._handle is None:
+            return False
+
+        self.__dict__.pop('_decoded', None)
+
+        return True
+
+    def numpy(self) -> numpy.ndarray:
+        if self._ndarray is not None:
+            return self._ndarray
+
+        return super().numpy()
+
+    def _materialize(self):
+        ndarray = self._ndarray
+
+        self.__dict__.pop('_decoded', None)
+        self.__dict__.pop('_handle', None)
+        self.__class__ = self.__array_type__
+
+        if ndarray is not None:
+            list.extend(self, map(self.__subtype__, ndarray.tolist()) if self.__subtype__ else ndarray.tolist())
+
+    def __len__(self):
+        if self._handle is not None:
+            return self._handle.length
+
+        if self._ndarray is not None:
+            return len(self._ndarray)
+
+        return super().__len__()
+
+    def __iter__(self):
+        if self._ndarray is not None:
+            return iter(self._ndarray)
+
+        return super().__iter__()
+
+    def __getitem__(self, item):
+        if self._ndarray is not None:
+            return self._ndarray[item]
+
+        return super().__getitem__(item)
+
+    def __contains__(self, item):
+        if self._ndarray is not None:
+            return item in self._ndarray
+
+        return super().__contains__(item)
+
+    def __reversed__(self):
+        if self._ndarray is not None:
+            return iter(self._ndarray[::-1])
+
+        return super().__reversed__()
+
+    def _values(self) -> list:
+        if self._ndarray is not None:
+            return list(map(self.__subtype__, self._ndarray.tolist()) if self.__subtype__ else self._ndarray.tolist())
+
+        return list.copy(self)
+
+    # The read-only list methods answer from the wrapped ndarray, only mutation materializes it
+    def copy(self) -> list:
+        return self._values()
+
+    def index(self, value, start: int = 0, stop: int = sys.maxsize) -> int:
+        if self._ndarray is None:
+            return super().index(value, start, stop)
+
+        positions = range(len(self._ndarray))[start:stop]
+        found = numpy.flatnonzero(self._ndarray[positions.start:positions.stop] == value)
+
+        if not len(found):
+            raise ValueError(f"{value!r} is not in list")
+
+        return positions.start + int(found[0])
+
+    def count(self, value) -> int:
+        if self._ndarray is None:
+            return super().count(value)
+
+        return int(numpy.count_nonzero(self._ndarray == value))
+
+    def __add__(self, other):
+        return self._values() + other
+
+    def __mul__(self, other):
+        return self._values() * other
+
+    def __eq__(self, other):
+        if self._ndarray is not None or isinstance(other, FBXArrayView) and other._ndarray is not None:
+            if not isinstance(other, (list, tuple, numpy.ndarray)):
+                return NotImplemented
+
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        if not self.decoded:
+            return f"{self.__class__.__name__}(<{len(self)} deferred>)"
+
+        if self._ndarray is not None:
+            return f"{self.__class__.__name__}({self._ndarray!r})"
+
+        return super().__repr__()
+
+
+def array_view(cls: type) -> type:
+    # Named like the array type, so views print and report themselves as it
+    cls.__array_type__ = cls
+    cls.__view__ = type(cls.__name__, (FBXArrayView, cls), {
+        '__array_type__': cls, '__module__': cls.__module__, '__qualname__': cls.__qualname__
+    })
+
+    return cls.__view__
+
+
+array_view(FBXArray)
+
+
+def _materializing(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+
+    return wrapper
+
+
+LIST_MUTATORS = ('append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse', '__setitem__',
+                 '__delitem__', '__iadd__', '__imul__')
+
+
+# Any in-place mutation converts a wrapped (possibly read-only) ndarray back to list items first
+for _method in LIST_MUTATORS:
+    setattr(FBXArrayView, _method, _materializing(_method))
+
+
+def invalidating(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._invalidate()
+
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+
+    return wrapper
 
 
 @schema
 class FloatArray(FBXArray):
     __subtype__ = float
+    __dtype__ = numpy.dtype('<f4')
 
 
 @schema
 class DoubleArray(FBXArray):
     __subtype__ = double
+    __dtype__ = numpy.dtype('<f8')
 
 
 @schema
 class IntArray(FBXArray):
     __subtype__ = int
+    __dtype__ = numpy.dtype('<i4')
 
 
 @schema
 class LongArray(FBXArray):
     __subtype__ = long
+    __dtype__ = numpy.dtype('<i8')
 
 
 @schema
 class BoolArray(FBXArray):
     __subtype__ = bool
+    __dtype__ = numpy.dtype('?')
 
 
 @schema
-class Properties70(set, FBXObject):
+class Properties70(FBXNode, list):
+    # Property70 nodes in insertion order, plus a name to property dict kept in step with the list
     def __init__(self, *properties):
-        super().__init__(*properties)
+        super().__init__("Properties70")
+
+        self.__dict__['_name_index'] = {}
+        self.extend(properties)
+
+    def _get_value(self):
+        return []
+
+    def _set_value(self, value: list):
+        if value:
+            raise FBXValidationException(f"Error, Properties70 takes no values, received {len(value)}", value)
+
+    _value = property(fget=_get_value, fset=_set_value)
+
+    @property
+    def _names(self) -> dict:
+        names = self.__dict__.get('_name_index')
 
-        self.name = "Properties70"
+        if names is None:
+            names = self.__dict__['_name_index'] = {prop.name: prop for prop in list.__iter__(self)}
+
+        return names
+
+    @property
+    def revision(self) -> int:
+        # Bumped on every change made through this container, lets cached views of it detect edits
+        return self.__dict__.get('_revision', 0)
+
+    def _changed(self):
+        self.__dict__['_revision'] = self.revision + 1
+
+    def find(self, name: str):
+        return self._names.get(name)
+
+    def get(self, name: str, default=None):
+        prop = self._names.get(name)
+
+        if prop is None:
+            return default
+
+        return prop.value
+
+    def set(self, name: str, value, type: str = None, label: str = "", flags: str = ""):
+        values = list(value) if isinstance(value, (list, tuple)) else [value]
+        prop = self._names.get(name)
+
+        if prop is None:
+            prop = Property70(name, type if type is not None else property_type(value), label, flags, *values)
+            self.append(prop)
+        else:
+            list.__setitem__(prop, slice(None), values)
+            self._changed()
+
+        return prop
+
+    def names(self):
+        return self._names.keys()
+
+    def append(self, prop: 'Property70'):
+        list.append(self, prop)
+        self._names[prop.name] = prop
+        self._changed()
+
+    def insert(self, position: int, prop: 'Property70'):
+        list.insert(self, position, prop)
+        self.__dict__.pop('_name_index', None)
+        self._changed()
+
+    def extend(self, properties):
+        for prop in properties:
+            self.append(prop)
+
+    def __iadd__(self, properties):
+        self.extend(properties)
+
+        return self
+
+    def remove(self, prop):
+        if isinstance(prop, str):
+            prop = self._names[prop]
+
+        position = next((i for i, existing in enumerate(self) if existing is prop), None)
+
+        self.pop(list.index(self, prop) if position is None else position)
+
+    def pop(self, position: int = -1):
+        prop = list.pop(self, position)
+        self.__dict__.pop('_name_index', None)
+        self._changed()
+
+        return prop
+
+    def clear(self):
+        list.clear(self)
+        self.__dict__['_name_index'] = {}
+        self._changed()
+
+    def __setitem__(self, key, value):
+        list.__setitem__(self, key, value)
+        self.__dict__.pop('_name_index', None)
+        self._changed()
+
+    def __delitem__(self, key):
+        list.__delitem__(self, key)
+        self.__dict__.pop('_name_index', None)
+        self._changed()
+
+    def __contains__(self, item):
+        if isinstance(item, str):
+            return item in self._names
+
+        return list.__contains__(self, item)
+
+    def __eq__(self, other):
+        return isinstance(other, Properties70) and len(self) == len(other) and \
+            all(a._value == b._value for a, b in zip(self, other))
+
+    __hash__ = object.__hash__
 
 
 @schema
@@ -297,6 +673,30 @@ class Property70(list, FBXNode):
 
     _value = property(fget=_get_value, fset=_set_value)
 
+    @property
+    def value(self):
+        if len(self) == 1:
+            return list.__getitem__(self, 0)
+
+        return tuple(self) if len(self) else None
+
+
+def property_type(value) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, long):
+        return "ULongLong"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "double"
+    if isinstance(value, str):
+        return "KString"
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        return "Vector3D"
+
+    raise FBXValidationException(f"Unable to infer a Property70 type for {value!r}, pass one explicitly", value)
+
 
 @schema
 class PropertyTemplate(FBXNode):
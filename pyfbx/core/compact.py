@@ -0,0 +1,69 @@
+import sys
+
+
+# Minimal record of a parsed node, no __dict__, listeners or child tracking. Node names are interned, properties are
+# held in a tuple and leaf nodes share an empty children tuple, use to_node() to convert to the schema classes
+class FBXCompactNode(object):
+    __slots__ = ('_name', 'properties', 'children')
+
+    def __init__(self, name: str, properties: tuple = (), children: list = None):
+        self._name = sys.intern(name)
+        self.properties = tuple(properties)
+        self.children = children if children else ()
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def _value(self):
+        return list(self.properties)
+
+    def append(self, child: 'FBXCompactNode'):
+        if not self.children:
+            self.children = []
+
+        self.children.append(child)
+
+    def find(self, name: str):
+        for child in self.children:
+            if child._name == name:
+                return child
+
+        return None
+
+    def find_all(self, name: str):
+        return [child for child in self.children if child._name == name]
+
+    def to_node(self, loader):
+        return loader.get_serializer(FBXCompactNode).expand(loader, self)
+
+    def __len__(self):
+        return len(self.children)
+
+    def __iter__(self):
+        return iter(self.children)
+
+    def __getitem__(self, item):
+        if isinstance(item, str):
+            child = self.find(item)
+
+            if child is None:
+                raise KeyError(item)
+
+            return child
+
+        return self.children[item]
+
+    def __eq__(self, other):
+        if not isinstance(other, FBXCompactNode):
+            return NotImplemented
+
+        return self._name == other._name and self.properties == other.properties and \
+            list(self.children) == list(other.children)
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self._name} ({len(self.properties)} properties, " \
+               f"{len(self.children)} children)>"
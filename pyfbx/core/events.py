@@ -49,4 +49,50 @@ class FBXEmitter:
             raise FBXException(f"Error emitting event {event}: Wrong event type {type(event)}: Expected {self._event_type}")
 
         for listener in self.listeners:
-            listener(event)
\ No newline at end of file
+            listener(event)
+
+
+class FBXStreamEvent(FBXEvent):
+    def __init__(self, node_name: str, offset: int = 0):
+        super().__init__(FBXEventType.EMITTER)
+
+        self.node_name = node_name
+        self.offset = offset
+
+
+class FBXNodeStartEvent(FBXStreamEvent):
+    def __init__(self, node_name: str, properties: list, offset: int = 0):
+        super().__init__(node_name, offset)
+
+        self.properties = properties
+
+
+class FBXArrayEvent(FBXStreamEvent):
+    def __init__(self, node_name: str, dtype, payload, offset: int = 0):
+        super().__init__(node_name, offset)
+
+        self.dtype = dtype
+        self.payload = payload
+
+
+class FBXNodeEndEvent(FBXStreamEvent):
+    pass
+
+
+class FBXStreamHandler(FBXEventHandler):
+    def __call__(self, event: FBXStreamEvent):
+        if isinstance(event, FBXNodeStartEvent):
+            self.node_start(event.node_name, event.properties)
+        elif isinstance(event, FBXArrayEvent):
+            self.array(event.node_name, event.dtype, event.payload)
+        elif isinstance(event, FBXNodeEndEvent):
+            self.node_end(event.node_name)
+
+    def node_start(self, name: str, properties: list):
+        pass
+
+    def array(self, name: str, dtype, payload):
+        pass
+
+    def node_end(self, name: str):
+        pass
@@ -0,0 +1,139 @@
+import numpy
+
+from pyfbx.exceptions import FBXValidationException
+
+
+class FBXConnection(object):
+    __slots__ = ('type', 'source', 'target', 'property')
+
+    def __init__(self, type: str, source: int, target: int, property: str = None):
+        self.type = type
+        self.source = source
+        self.target = target
+        self.property = property
+
+    def __eq__(self, other):
+        return isinstance(other, FBXConnection) and \
+               (self.type, self.source, self.target, self.property) == \
+               (other.type, other.source, other.target, other.property)
+
+    def __hash__(self):
+        return hash((self.type, self.source, self.target, self.property))
+
+    def __repr__(self):
+        return f"C: \"{self.type}\", {self.source}, {self.target}" + \
+               (f", \"{self.property}\"" if self.property is not None else "")
+
+
+# Adjacency maps over the connections of a file. FBX connections point from child (source) to parent (target), so
+# an object's parents are the targets of its outgoing connections and its children the sources of its incoming ones
+class FBXConnectionGraph(object):
+    def __init__(self, connections=()):
+        self.connections = []
+        self.outgoing = {}
+        self.incoming = {}
+
+        self._pairs = None
+
+        for connection in connections:
+            self.add(connection)
+
+    @classmethod
+    def from_node(cls, connections) -> 'FBXConnectionGraph':
+        return cls(connection_record(node) for node in connections)
+
+    def add(self, connection: FBXConnection):
+        self.connections.append(connection)
+        self.outgoing.setdefault(connection.source, []).append(connection)
+        self.incoming.setdefault(connection.target, []).append(connection)
+
+        self._pairs = None
+
+    def remove(self, connection: FBXConnection):
+        self.connections.remove(connection)
+        self.outgoing[connection.source].remove(connection)
+        self.incoming[connection.target].remove(connection)
+
+        self._pairs = None
+
+    def connections_from(self, uid: int, type: str = None) -> list:
+        connections = self.outgoing.get(uid, ())
+
+        return [c for c in connections if c.type == type] if type is not None else list(connections)
+
+    def connections_to(self, uid: int, type: str = None) -> list:
+        connections = self.incoming.get(uid, ())
+
+        return [c for c in connections if c.type == type] if type is not None else list(connections)
+
+    def parents(self, uid: int, type: str = None) -> list:
+        return [c.target for c in self.connections_from(uid, type)]
+
+    def children(self, uid: int, type: str = None) -> list:
+        return [c.source for c in self.connections_to(uid, type)]
+
+    def ancestors(self, uid: int, type: str = None) -> list:
+        return self._closure(uid, self.parents, type)
+
+    def descendants(self, uid: int, type: str = None) -> list:
+        return self._closure(uid, self.children, type)
+
+    def _closure(self, uid: int, neighbours, type: str = None) -> list:
+        # Breadth first, each UID is reported once even if the graph has cycles
+        visited = {uid}
+        closure = []
+        frontier = [uid]
+
+        while frontier:
+            next_frontier = []
+
+            for current in frontier:
+                for neighbour in neighbours(current, type):
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        closure.append(neighbour)
+                        next_frontier.append(neighbour)
+
+            frontier = next_frontier
+
+        return closure
+
+    def pairs(self) -> numpy.ndarray:
+        # (N, 2) int64 array of source, target UIDs in connection order
+        if self._pairs is None:
+            pairs = numpy.empty((len(self.connections), 2), dtype=numpy.int64)
+
+            for i, connection in enumerate(self.connections):
+                pairs[i] = connection.source, connection.target
+
+            pairs.flags.writeable = False
+            self._pairs = pairs
+
+        return self._pairs
+
+    def __contains__(self, item):
+        if isinstance(item, FBXConnection):
+            return item in self.outgoing.get(item.source, ())
+
+        source, target = item
+
+        return any(c.target == target for c in self.outgoing.get(source, ()))
+
+    def __len__(self):
+        return len(self.connections)
+
+    def __iter__(self):
+        return iter(self.connections)
+
+
+def connection_record(node) -> FBXConnection:
+    # Parsed connections are generic "C" nodes holding [type, source, target(, property)]
+    values = getattr(node, '_value', None) or []
+
+    if len(values) < 3:
+        if 'source' in getattr(node, '__dict__', ()):
+            return FBXConnection(node.type, node.source, node.target, node.__dict__.get('target_member'))
+
+        raise FBXValidationException(f"Connection has {len(values)} values, expected at least 3", node)
+
+    return FBXConnection(values[0], values[1], values[2], values[3] if len(values) > 3 else None)
@@ -0,0 +1,150 @@
+import zlib
+
+import numpy
+
+from pyfbx.core.common import FBXNode, FBXArrayEncoding
+from pyfbx.exceptions import FBXSerializationException
+from pyfbx.io import FBXMappedStream
+
+
+# Stands in for a node whose record has been located but not parsed, properties and children are only read from the
+# underlying stream on first access
+class FBXLazyNode(FBXNode):
+    __own__ = frozenset(('_name', '_loader', '_data', '_start', '_end', '_kwargs', '_node'))
+
+    def __init__(self, name: str, loader, data, start: int, end: int, **kwargs):
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_loader', loader)
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_start', start)
+        object.__setattr__(self, '_end', end)
+        object.__setattr__(self, '_kwargs', kwargs)
+        object.__setattr__(self, '_node', None)
+
+    @property
+    def loaded(self):
+        return self._node is not None
+
+    @property
+    def size(self):
+        return self._end - self._start
+
+    def load(self):
+        if self._node is None:
+            object.__setattr__(self, '_node', self._parse())
+
+        return self._node
+
+    def unload(self):
+        object.__setattr__(self, '_node', None)
+
+    def _parse(self):
+        data = self._data
+
+        if getattr(data, 'closed', False):
+            with open(data.name, 'rb') as reopened:
+                reopened.seek(self._start)
+
+                return self._loader.deserialize(reopened, FBXNode, **self._kwargs)
+
+        position = data.tell()
+        data.seek(self._start)
+
+        try:
+            return self._loader.deserialize(data, FBXNode, **self._kwargs)
+        finally:
+            data.seek(position)
+
+    @property
+    def properties(self):
+        return self.load().properties
+
+    @property
+    def children(self):
+        return self.load().children
+
+    def __getattr__(self, name):
+        if name in self.__own__ or (name.startswith('__') and name.endswith('__')):
+            raise AttributeError(name)
+
+        return getattr(self.load(), name)
+
+    def __setattr__(self, name, value):
+        if name in self.__own__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.load(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.load(), name)
+
+    def __len__(self):
+        return len(self.load())
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __getitem__(self, item):
+        return self.load()[item]
+
+    def __contains__(self, item):
+        return item in self.load()
+
+    def __eq__(self, other):
+        return self.load() == (other.load() if isinstance(other, FBXLazyNode) else other)
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else f"bytes {self._start}-{self._end}"
+
+        return f"<{self.__class__.__name__} {self._name} ({state})>"
+
+
+# Location of an array payload that has not been decoded yet, kept by deferred FBXArrays
+class FBXArrayHandle(object):
+    __slots__ = ('data', 'offset', 'length', 'encoding', 'bytes_length', 'dtype')
+
+    def __init__(self, data, offset: int, length: int, encoding: FBXArrayEncoding, bytes_length: int,
+                 dtype: numpy.dtype):
+        self.data = data
+        self.offset = offset
+        self.length = length
+        self.encoding = encoding
+        self.bytes_length = bytes_length
+        self.dtype = dtype
+
+    def read(self):
+        data = self.data
+
+        if isinstance(data, FBXMappedStream) and not data.closed:
+            return data.buffer[self.offset:self.offset + self.bytes_length]
+
+        if getattr(data, 'closed', False):
+            with open(data.name, 'rb') as reopened:
+                reopened.seek(self.offset)
+
+                return reopened.read(self.bytes_length)
+
+        position = data.tell()
+        data.seek(self.offset)
+
+        try:
+            return data.read(self.bytes_length)
+        finally:
+            data.seek(position)
+
+    def decode(self) -> numpy.ndarray:
+        payload = self.read()
+
+        try:
+            if self.encoding == FBXArrayEncoding.COMPRESSED:
+                payload = zlib.decompress(payload)
+
+            return numpy.frombuffer(payload, dtype=self.dtype, count=self.length)
+        except zlib.error as e:
+            raise FBXSerializationException(f"Unable to decompress deferred array at {self.offset}", cause=e)
+        except ValueError as e:
+            raise FBXSerializationException(
+                f"Expected {self.length} elements in deferred array at {self.offset}, payload is only "
+                f"{len(payload)} bytes", cause=e)
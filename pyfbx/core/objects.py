@@ -1,6 +1,12 @@
+import collections
+
 from pybran.decorators import schema, field
 
-from .common import PropertyTemplate, FBXNode, Properties70, long
+from pyfbx.exceptions import FBXValidationException
+
+from .common import PropertyTemplate, FBXNode, Properties70, long, invalidating, LIST_MUTATORS
+from .compact import FBXCompactNode
+from .lazy import FBXLazyNode
 
 
 @schema
@@ -11,13 +17,177 @@ class ObjectType(FBXNode):
 
 @schema
 class Definitions(FBXNode, list):
+    def object_type(self, name: str) -> ObjectType:
+        # ObjectType nodes keyed by the object class they describe, e.g. "Model", rebuilt after any list change
+        object_types = self.__dict__.get('_object_types')
+
+        if object_types is None:
+            object_types = self.__dict__['_object_types'] = {
+                object_type._value[0]: object_type for object_type in list.__iter__(self)
+                if isinstance(object_type, ObjectType) and getattr(object_type, '_value', None)
+            }
+
+        return object_types.get(name)
+
+    def _invalidate(self):
+        self.__dict__.pop('_object_types', None)
+
     version = field(int, alias='Version')
     count = field(int, alias='Count')
 
 
+for _method in LIST_MUTATORS:
+    setattr(Definitions, _method, invalidating(_method))
+
+
+# Parsed objects are generic nodes named by their kind (Model, Geometry...) holding [uid, "Name\x00\x01Kind", class],
+# schema Object instances carry the same as their uid and class_ fields
+def object_uid(node):
+    uid = node.__dict__.get('uid') if hasattr(node, '__dict__') else None
+
+    if uid is None:
+        values = getattr(node, '_value', None)
+        uid = values[0] if values and isinstance(values[0], int) else None
+
+    return uid
+
+
+def object_class(node):
+    class_ = node.__dict__.get('class_') if hasattr(node, '__dict__') else None
+
+    if class_ is None:
+        values = getattr(node, '_value', None)
+        class_ = values[2] if values and len(values) > 2 and isinstance(values[2], str) else None
+
+    return class_
+
+
+class FBXObjectIndex(object):
+    def __init__(self, objects=()):
+        self.uids = {}
+        self.classes = {}
+        self.names = {}
+
+        for obj in objects:
+            self.add(obj)
+
+    def add(self, obj):
+        uid = object_uid(obj)
+
+        if uid is not None:
+            self.uids[uid] = obj
+
+        self.classes.setdefault(object_class(obj), []).append(obj)
+        self.names.setdefault(obj._name, []).append(obj)
+
+    def remove(self, obj):
+        uid = object_uid(obj)
+
+        if uid is not None and self.uids.get(uid) is obj:
+            del self.uids[uid]
+
+        for index, key in ((self.classes, object_class(obj)), (self.names, obj._name)):
+            objects = index.get(key, [])
+            objects[:] = [o for o in objects if o is not obj]
+
+            if not objects:
+                index.pop(key, None)
+
+
 @schema
 class Objects(FBXNode, list):
-    pass
+    def object_index(self) -> FBXObjectIndex:
+        # Built on first use, then kept up to date as objects are added and removed
+        index = self.__dict__.get('_index')
+
+        if index is None:
+            index = self.__dict__['_index'] = FBXObjectIndex(self)
+
+        return index
+
+    def get(self, uid: int, default=None):
+        return self.object_index().uids.get(uid, default)
+
+    def of_class(self, class_: str) -> list:
+        return list(self.object_index().classes.get(class_, ()))
+
+    def named(self, name: str) -> list:
+        return list(self.object_index().names.get(name, ()))
+
+    def _indexed(self):
+        return self.__dict__.get('_index')
+
+    def _invalidate(self):
+        self.__dict__.pop('_index', None)
+
+    def append(self, obj):
+        super().append(obj)
+
+        if self._indexed() is not None:
+            self._indexed().add(obj)
+
+    def insert(self, position, obj):
+        appended = position >= len(self)
+        super().insert(position, obj)
+
+        # Lookups keep list order, so only an insert at the end can be added to the index in place
+        if not appended:
+            self._invalidate()
+        elif self._indexed() is not None:
+            self._indexed().add(obj)
+
+    def extend(self, objects):
+        objects = list(objects)
+        super().extend(objects)
+
+        if self._indexed() is not None:
+            for obj in objects:
+                self._indexed().add(obj)
+
+    def __iadd__(self, objects):
+        self.extend(objects)
+
+        return self
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._invalidate()
+
+        return self
+
+    def remove(self, obj):
+        # Node equality only compares names, so prefer removing this exact object
+        position = next((i for i, existing in enumerate(self) if existing is obj), None)
+
+        self.pop(super().index(obj) if position is None else position)
+
+    def pop(self, position=-1):
+        obj = super().pop(position)
+
+        if self._indexed() is not None:
+            self._indexed().remove(obj)
+
+        return obj
+
+    def clear(self):
+        super().clear()
+        self._invalidate()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._invalidate()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate()
 
 
 @schema
@@ -29,3 +199,80 @@ class Object(FBXNode):
     properties70 = field(Properties70, alias='Properties70')
     version = field(int, alias='Version')
     _name = field(str, alias='Name')
+
+
+def object_properties(obj) -> Properties70:
+    # Parsed objects hold their overrides under the raw node name, schema objects under their properties70 field
+    attributes = getattr(obj, '__dict__', {})
+    properties70 = attributes.get('properties70')
+
+    return properties70 if properties70 is not None else attributes.get('Properties70')
+
+
+# Resolves effective property values, an object's own Properties70 overrides take precedence over the PropertyTemplate
+# defined for its class under Definitions. Template values are memoized per (object class, template) and recomputed
+# once the template's Properties70 has been edited. Lazy Definitions are loaded, compact ones are expanded with loader.
+class FBXPropertyResolver(object):
+    def __init__(self, definitions: Definitions = None, loader=None):
+        if isinstance(definitions, FBXLazyNode):
+            definitions = definitions.load()
+        elif isinstance(definitions, FBXCompactNode):
+            if loader is None:
+                raise FBXValidationException("Resolving properties from a compact Definitions node needs a loader",
+                                             definitions)
+
+            definitions = definitions.to_node(loader)
+
+        if definitions is not None and not isinstance(definitions, Definitions):
+            raise FBXValidationException(f"Expected a Definitions node, got {type(definitions).__name__}", definitions)
+
+        self.definitions = definitions
+        self.templates = {}
+
+    @classmethod
+    def from_file(cls, file, loader=None) -> 'FBXPropertyResolver':
+        return cls(file.__dict__.get('definitions'), loader)
+
+    def template(self, obj) -> PropertyTemplate:
+        if self.definitions is None:
+            return None
+
+        object_type = self.definitions.object_type(obj._name)
+
+        return object_type.__dict__.get('property_template') if object_type is not None else None
+
+    def defaults(self, obj) -> dict:
+        template = self.template(obj)
+        properties70 = template.__dict__.get('properties70') if template is not None else None
+
+        if properties70 is None:
+            return {}
+
+        key = (obj._name, template.name)
+        cached = self.templates.get(key)
+
+        if cached is None or cached[0] is not properties70 or cached[1] != properties70.revision:
+            values = {prop.name: prop.value for prop in properties70}
+            cached = self.templates[key] = (properties70, properties70.revision, values)
+
+        return cached[2]
+
+    def resolve(self, obj, name: str, default=None):
+        overrides = object_properties(obj)
+
+        if overrides is not None:
+            prop = overrides.find(name)
+
+            if prop is not None:
+                return prop.value
+
+        return self.defaults(obj).get(name, default)
+
+    def effective(self, obj) -> collections.ChainMap:
+        overrides = object_properties(obj)
+        values = {prop.name: prop.value for prop in overrides} if overrides is not None else {}
+
+        return collections.ChainMap(values, self.defaults(obj))
+
+    def invalidate(self):
+        self.templates.clear()
@@ -0,0 +1,198 @@
+import json
+import os
+
+from pyfbx.core import FBXFile, FBXNode
+from pyfbx.exceptions import FBXSerializationException
+from pyfbx.io import FBXMappedStream
+from pyfbx.serializers import FBXFileSerializer, read_struct, codecs
+
+
+class FBXIndexEntry(object):
+    __slots__ = ('name', 'start', 'end', 'properties', 'uid', 'children')
+
+    def __init__(self, name: str, start: int, end: int, properties: int, uid: int = None, children: list = None):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.properties = properties
+        self.uid = uid
+        self.children = children if children is not None else []
+
+    @property
+    def size(self):
+        return self.end - self.start
+
+    def to_json(self):
+        entry = [self.name, self.start, self.end, self.properties, self.uid]
+
+        if self.children:
+            entry.append([child.to_json() for child in self.children])
+
+        return entry
+
+    @classmethod
+    def from_json(cls, entry: list):
+        children = [cls.from_json(child) for child in entry[5]] if len(entry) > 5 else None
+
+        return cls(*entry[:5], children=children)
+
+    def __eq__(self, other):
+        return isinstance(other, FBXIndexEntry) and self.to_json() == other.to_json()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name} ({self.start}-{self.end}, {len(self.children)} children)>"
+
+
+# Node boundaries of the top level sections of a file and of their direct children, built from the end offsets in
+# each node header without parsing any properties beyond a leading UID
+class FBXFileIndex(object):
+    SIDECAR_EXTENSION = '.fbxidx'
+    INDEX_VERSION = 1
+
+    def __init__(self, loader, path: str, entries: list, version: int = 0, size: int = 0, mtime: int = 0):
+        self.loader = loader
+        self.path = path
+        self.entries = entries
+        self.version = version
+        self.size = size
+        self.mtime = mtime
+
+        self.sections = {entry.name: entry for entry in entries}
+        self.objects = {child.uid: child for entry in entries if entry.name == 'Objects'
+                        for child in entry.children if child.uid is not None}
+
+    @classmethod
+    def build(cls, loader, path: str, **kwargs):
+        serializer: FBXFileSerializer = loader.get_serializer(FBXFile)
+
+        with FBXMappedStream.open(path) as data:
+            version = serializer.deserialize_header(loader, data, **kwargs)
+            file_size = serializer.stream_size(data)
+
+            entries = []
+            while file_size - data.tell() > serializer.EMPTY_NODE_SIZE * 7:
+                entry = cls.index_node(serializer, data, skip_children=False, **kwargs)
+
+                if entry is None:
+                    continue
+
+                while data.tell() < entry.end:
+                    child = cls.index_node(serializer, data, **kwargs)
+
+                    if child is not None:
+                        entry.children.append(child)
+
+                data.seek(entry.end)
+                entries.append(entry)
+
+        stat = os.stat(path)
+
+        return cls(loader, path, entries, version, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def index_node(cls, serializer: FBXFileSerializer, data, skip_children: bool = True, **kwargs):
+        start = data.tell()
+        end, properties, properties_len, name = serializer.deserialize_node_header(data, **kwargs)
+
+        if not name:
+            return None
+
+        children_start = data.tell() + properties_len
+
+        uid = None
+        if properties and bytes(data.read(1)) == b'L':
+            value = read_struct(data, codecs[b'L'])
+            uid = value[0] if value is not None else None
+
+        data.seek(end if skip_children else children_start)
+
+        return FBXIndexEntry(name, start, end, properties, uid)
+
+    @classmethod
+    def sidecar_path(cls, path: str):
+        return str(path) + cls.SIDECAR_EXTENSION
+
+    @classmethod
+    def open(cls, loader, path: str, **kwargs):
+        # Reuses a saved sidecar while it still matches the file, otherwise rebuilds (and saves, if save=True) it
+        save = kwargs.pop('save', False)
+
+        try:
+            return cls.load(loader, path)
+        except (OSError, ValueError, FBXSerializationException):
+            index = cls.build(loader, path, **kwargs)
+
+            if save:
+                index.save()
+
+            return index
+
+    @classmethod
+    def load(cls, loader, path: str, sidecar: str = None):
+        sidecar = sidecar or cls.sidecar_path(path)
+
+        with open(sidecar, 'r') as file:
+            saved = json.load(file)
+
+        if not isinstance(saved, dict):
+            raise FBXSerializationException("FBX index sidecar is malformed", sidecar)
+
+        stat = os.stat(path)
+
+        if saved.get('index_version') != cls.INDEX_VERSION:
+            raise FBXSerializationException("FBX index sidecar has an unsupported version", saved.get('index_version'))
+        if saved.get('size') != stat.st_size or saved.get('mtime') != stat.st_mtime_ns:
+            raise FBXSerializationException("FBX index sidecar is out of date", path)
+
+        try:
+            entries = [FBXIndexEntry.from_json(entry) for entry in saved['entries']]
+
+            return cls(loader, path, entries, saved['version'], saved['size'], saved['mtime'])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise FBXSerializationException("FBX index sidecar is malformed", sidecar, e)
+
+    def save(self, sidecar: str = None):
+        saved = {
+            'index_version': self.INDEX_VERSION,
+            'version': self.version,
+            'size': self.size,
+            'mtime': self.mtime,
+            'entries': [entry.to_json() for entry in self.entries]
+        }
+
+        with open(sidecar or self.sidecar_path(self.path), 'w') as file:
+            json.dump(saved, file, separators=(',', ':'))
+
+    def find(self, name: str) -> FBXIndexEntry:
+        return self.sections.get(name)
+
+    def find_object(self, uid: int) -> FBXIndexEntry:
+        return self.objects.get(uid)
+
+    def load_entry(self, entry: FBXIndexEntry, **kwargs) -> FBXNode:
+        with open(self.path, 'rb') as data:
+            data.seek(entry.start)
+
+            return self.loader.deserialize(data, FBXNode, **kwargs)
+
+    def load_section(self, name: str, **kwargs) -> FBXNode:
+        entry = self.find(name)
+
+        if entry is None:
+            raise FBXSerializationException(f"No {name} section in {self.path}", name)
+
+        return self.load_entry(entry, **kwargs)
+
+    def load_object(self, uid: int, **kwargs) -> FBXNode:
+        entry = self.find_object(uid)
+
+        if entry is None:
+            raise FBXSerializationException(f"No Object with UID {uid} in {self.path}", uid)
+
+        return self.load_entry(entry, **kwargs)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
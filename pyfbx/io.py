@@ -1,12 +1,97 @@
-import pathlib
+import io
+import mmap
+import os
+
+from pyfbx.exceptions import FBXSerializationException
 
 
 class FBXPeripheral(object):
-    def __init__(self, path: pathlib.Path):
+    def __init__(self, path: os.PathLike):
         self.path = path
 
     def load(self):
         pass
 
     def unload(self):
-        pass
\ No newline at end of file
+        pass
+
+
+class FBXMappedStream(io.RawIOBase):
+    # Read only stream over a memory mapped file, reads return memoryview slices of the mapping rather than copies
+    def __init__(self, mapping: mmap.mmap, name: str = None):
+        super().__init__()
+
+        self.mapping = mapping
+        self.buffer = memoryview(mapping)
+        self.position = 0
+        self.name = name
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'rb') as file:
+            return cls.from_file(file)
+
+    @classmethod
+    def from_file(cls, file):
+        # The mapping holds its own handle on the file, so it stays valid once the file object is closed
+        name = getattr(file, 'name', None)
+
+        try:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), name)
+        except (OSError, ValueError) as e:
+            # Empty files can't be mapped, neither can in memory streams without a file descriptor
+            raise FBXSerializationException(f"Unable to memory map {name or type(file).__name__}", cause=e)
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size: int = -1) -> memoryview:
+        start = self.position
+        end = len(self.buffer) if size is None or size < 0 else min(start + size, len(self.buffer))
+
+        self.position = max(start, end)
+
+        return self.buffer[start:end]
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, buffer):
+        view = self.read(len(buffer))
+        buffer[:len(view)] = view
+
+        return len(view)
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        self.position = offset
+
+        return self.position
+
+    def close(self):
+        if self.closed:
+            return
+
+        super().close()
+
+        try:
+            self.buffer.release()
+            self.mapping.close()
+        except BufferError:
+            pass  # Arrays decoded from the mapping still reference it, it is unmapped once they are collected
@@ -0,0 +1,115 @@
+import json
+
+
+class FBXMetricsEntry(object):
+    __slots__ = ('count', 'bytes', 'seconds', 'compressed_bytes', 'decompressed_bytes')
+
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.compressed_bytes = 0
+        self.decompressed_bytes = 0
+
+    @property
+    def compression_ratio(self):
+        return self.decompressed_bytes / self.compressed_bytes if self.compressed_bytes else None
+
+    def to_json(self):
+        return {
+            'count': self.count,
+            'bytes': self.bytes,
+            'seconds': self.seconds,
+            'compressed_bytes': self.compressed_bytes,
+            'decompressed_bytes': self.decompressed_bytes,
+        }
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={self.count}, bytes={self.bytes}, seconds={self.seconds:.6f}>"
+
+
+# Opt-in counters for the node and list serializers, passed as metrics= to loader.read/deserialize/serialize/write.
+# Node entries are keyed by node name and are inclusive of their children, property entries are keyed by FBX type code.
+# Array entries also track their payload sizes before (decompressed) and after (compressed) zlib, arrays written
+# uncompressed count the same size for both.
+class FBXMetrics(object):
+    def __init__(self):
+        self.nodes = {}
+        self.properties = {}
+
+    def node(self, name: str) -> FBXMetricsEntry:
+        entry = self.nodes.get(name)
+
+        if entry is None:
+            entry = self.nodes[name] = FBXMetricsEntry()
+
+        return entry
+
+    def property(self, code: bytes) -> FBXMetricsEntry:
+        entry = self.properties.get(code)
+
+        if entry is None:
+            entry = self.properties[code] = FBXMetricsEntry()
+
+        return entry
+
+    def record_node(self, name: str, size: int, seconds: float):
+        entry = self.node(name)
+        entry.count += 1
+        entry.bytes += size
+        entry.seconds += seconds
+
+    def record_property(self, code: bytes, size: int, seconds: float):
+        entry = self.property(code)
+        entry.count += 1
+        entry.bytes += size
+        entry.seconds += seconds
+
+    def record_array(self, code: bytes, compressed: int, decompressed: int):
+        entry = self.property(code)
+        entry.compressed_bytes += compressed
+        entry.decompressed_bytes += decompressed
+
+    def merge(self, other: 'FBXMetrics'):
+        for entries, lookup in ((other.nodes, self.node), (other.properties, self.property)):
+            for key, other_entry in entries.items():
+                entry = lookup(key)
+
+                for attribute in FBXMetricsEntry.__slots__:
+                    setattr(entry, attribute, getattr(entry, attribute) + getattr(other_entry, attribute))
+
+        return self
+
+    def reset(self):
+        self.nodes.clear()
+        self.properties.clear()
+
+    def to_json(self):
+        return {
+            'nodes': {name: entry.to_json() for name, entry in self.nodes.items()},
+            'properties': {code.decode('ascii'): entry.to_json() for code, entry in self.properties.items()},
+        }
+
+    def dumps(self, **kwargs) -> str:
+        return json.dumps(self.to_json(), **kwargs)
+
+    def summary(self, limit: int = 10) -> str:
+        # The most expensive nodes and property types by wall time, nodes are inclusive so parents rank above children
+        lines = []
+
+        for title, entries in (('Nodes', self.nodes), ('Properties', self.properties)):
+            lines.append(f"{title}:")
+
+            for key, entry in sorted(entries.items(), key=lambda item: item[1].seconds, reverse=True)[:limit]:
+                key = key.decode('ascii') if isinstance(key, bytes) else key
+                line = f"  {key:<24} {entry.count:>10} {entry.bytes:>14}B {entry.seconds:>10.4f}s"
+
+                if entry.compressed_bytes:
+                    line += f" {entry.compressed_bytes}B -> {entry.decompressed_bytes}B"
+
+                lines.append(line)
+
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self.nodes)} node names, {len(self.properties)} property types>"
@@ -1,7 +1,9 @@
+import array
 import enum
-import os
+import fnmatch
 import io
 import struct
+import time
 
 from pybran.decorators import class_registry, type_registry
 from pybran.exceptions import BranSerializerException
@@ -9,13 +11,15 @@ from pybran.serializers import Serializer
 
 from pyfbx import FBXFile
 from pyfbx.exceptions import FBXSerializationException, FBXValidationException
-from pyfbx.core.common import FBXNode, FBXArray, long, double, short, char, FBXArrayEncoding
+from pyfbx.core.common import FBXObject, FBXNode, FBXArray, FloatArray, DoubleArray, LongArray, IntArray, BoolArray, \
+    long, double, short, char, FBXArrayEncoding
+from pyfbx.core.compact import FBXCompactNode
+from pyfbx.core.lazy import FBXLazyNode, FBXArrayHandle
+from pyfbx.io import FBXMappedStream
 
 import zlib
 
-import logging
-
-log = logging.getLogger(__name__)
+import numpy
 
 byte_sizes = {
     bool: 1,
@@ -27,69 +31,122 @@ byte_sizes = {
     double: 8,
 }
 
-struct_formatters = {
-    bool: '?',
-    char: 'c',
-    short: 'h',
+array_typecodes = {
+    bool: 'b',
     int: 'i',
     float: 'f',
     long: 'q',
     double: 'd',
 }
 
+# Precompiled codecs keyed by FBX binary type code
+codecs = {
+    b'Y': struct.Struct('<h'),
+    b'C': struct.Struct('<?'),
+    b'I': struct.Struct('<i'),
+    b'F': struct.Struct('<f'),
+    b'D': struct.Struct('<d'),
+    b'L': struct.Struct('<q'),
+}
+
+type_codes = {
+    short: b'Y',
+    bool: b'C',
+    int: b'I',
+    float: b'F',
+    double: b'D',
+    long: b'L',
+    str: b'S',
+    bytes: b'R',
+    FloatArray: b'f',
+    DoubleArray: b'd',
+    LongArray: b'l',
+    IntArray: b'i',
+    BoolArray: b'b',
+}
+
+# Wrapped and deferred arrays are instances of their array type's view, see FBXArray
+type_codes.update({cls.__view__: type_codes[cls] for cls in (FloatArray, DoubleArray, LongArray, IntArray, BoolArray)})
+
+primitive_codecs = {cls: codecs.get(code) for cls, code in type_codes.items() if code in codecs}
+primitive_codecs[char] = struct.Struct('c')
+
+uint8_codec = struct.Struct('<B')
+uint32_codec = struct.Struct('<I')
+array_header_codec = struct.Struct('<iii')  # Length, Encoding, Bytes Length
+node_body_codec = struct.Struct('<qq')  # Properties, Properties Length
+node_header_codec = struct.Struct('<qqqB')  # End Offset, Properties, Properties Length, Name Length
+
+
+def read_struct(data, codec: struct.Struct):
+    # Returns None when the stream holds fewer than codec.size bytes
+    if isinstance(data, FBXMappedStream):
+        position = data.position
+
+        if position + codec.size > len(data.buffer):
+            data.position = len(data.buffer)
+            return None
+
+        data.position = position + codec.size
+
+        return codec.unpack_from(data.buffer, position)
+
+    raw_bytes = data.read(codec.size)
+
+    if len(raw_bytes) < codec.size:
+        return None
+
+    return codec.unpack(raw_bytes)
+
 
 class PrimitiveSerializer(Serializer):
     def serialize(self, loader, obj, **kwargs):
         primitive_type = type(obj)
         ignore_prefix = kwargs.get('ignore_prefix', True)
 
-        if primitive_type not in struct_formatters:
+        codec = primitive_codecs.get(primitive_type)
+
+        if codec is None:
             raise FBXSerializationException(
                 f"No struct packing formatter found for primitive {obj} of type {primitive_type}", obj)
 
-        if not ignore_prefix and not type_registry.contains(primitive_type):
+        if not ignore_prefix and primitive_type not in type_codes:
             raise FBXSerializationException(f"No type found in type_registry for primitive {obj} of type {primitive_type}", obj)
 
-        serialized = b''
-
-        if len(str(obj).encode()) < 1:
-            return serialized
+        if primitive_type is char and len(obj.encode()) < 1:
+            return b''
 
         if not ignore_prefix:
-            serialized += struct.pack('c', type_registry.get(primitive_type))
+            return type_codes.get(primitive_type) + codec.pack(obj)
 
-        serialized += struct.pack(struct_formatters.get(primitive_type), obj)
-
-        return serialized
+        return codec.pack(obj)
 
     def deserialize(self, loader, cls, data, **kwargs):
         ignore_prefix = kwargs.get('ignore_prefix', True)
 
         if not ignore_prefix:
-            data_type = struct.unpack('c', data.read(1))[0]
+            data_type = bytes(data.read(1))
 
             if not type_registry.contains(data_type):
                 raise FBXSerializationException(f"No type registered for data type {data_type}", data.read())
 
             cls = type_registry.get(data_type)
 
-        if cls not in byte_sizes:
-            raise FBXSerializationException(f"Unknown byte size for primitive {cls}", data.read())
+        codec = primitive_codecs.get(cls)
 
-        if cls not in struct_formatters:
+        if codec is None:
             raise FBXSerializationException(f"No struct packing formatter found for primitive {cls}", data.read())
 
         try:
-            data_bytes_size = byte_sizes.get(cls)
-            raw_bytes = data.read(data_bytes_size)
-
-            if len(raw_bytes) < data_bytes_size:
-                return cls()
-
-            return cls(struct.unpack(struct_formatters.get(cls), raw_bytes)[0])
+            values = read_struct(data, codec)
         except struct.error as e:
             raise FBXSerializationException(f"Unable to deserialize {cls} from data", data.read(), e)
 
+        if values is None:
+            return cls()
+
+        return cls(values[0])
+
 
 class EnumSerializer(PrimitiveSerializer):
     def serialize(self, loader, obj: enum.Enum, **kwargs):
@@ -101,48 +158,49 @@ class EnumSerializer(PrimitiveSerializer):
 
 class StringSerializer(Serializer):
     def serialize(self, loader, obj: str, **kwargs):
-        buffer = b''
+        encoded = bytes(obj, 'utf8')
 
-        ignore_prefix = kwargs.get('ignore_prefix', True)
+        if not kwargs.get('ignore_prefix', True):
+            return type_codes.get(str) + uint32_codec.pack(len(encoded)) + encoded
 
-        if not ignore_prefix:
-            if not type_registry.contains(str):
-                raise FBXSerializationException("No type found in type_registry for str!", obj)
+        return uint32_codec.pack(len(encoded)) + encoded
 
-            buffer += struct.pack('c', type_registry.get(str))
+    def deserialize(self, loader, cls, data, **kwargs) -> str:
+        header = read_struct(data, uint32_codec)
 
-        length = len(obj)
-        buffer += struct.pack('I', length)
-        buffer += struct.pack(f"{length}s", bytes(obj, 'utf8'))
+        if header is None:
+            raise FBXSerializationException("Unable to deserialize str from data, missing length", data.read())
 
-        return buffer
+        raw_bytes = data.read(header[0])
 
-    def deserialize(self, loader, cls, data, **kwargs) -> str:
-        try:
-            length = struct.unpack('I', data.read(4))[0]
+        if len(raw_bytes) < header[0]:
+            raise FBXSerializationException(f"Unable to deserialize str from data, expected {header[0]} bytes", raw_bytes)
 
-            return struct.unpack(f"{length}s", data.read(length))[0].decode('utf8')
-        except struct.error as e:
-            raise FBXSerializationException("Unable to deserialize str from data", data.read(), e)
+        try:
+            return str(raw_bytes, 'utf8')
+        except UnicodeDecodeError as e:
+            raise FBXSerializationException("Unable to deserialize str from data", raw_bytes, e)
 
 
 class BytesSerializer(Serializer):
     def serialize(self, loader, obj: bytes, **kwargs):
-        buffer = b''
+        if not kwargs.get('ignore_prefix', True):
+            return type_codes.get(bytes) + uint32_codec.pack(len(obj)) + obj
 
-        length = len(obj)
-        buffer += struct.pack('I', length)
-        buffer += struct.pack(f"{length}s", obj)
-
-        return buffer
+        return uint32_codec.pack(len(obj)) + obj
 
     def deserialize(self, loader, cls, data, **kwargs) -> bytes:
-        try:
-            length = struct.unpack('I', data.read(4))[0]
+        header = read_struct(data, uint32_codec)
 
-            return struct.unpack(f"{length}s", data.read(length))[0]
-        except struct.error as e:
-            raise FBXSerializationException("Unable to deserialize bytes from data", data.read(), e)
+        if header is None:
+            raise FBXSerializationException("Unable to deserialize bytes from data, missing length", data.read())
+
+        raw_bytes = data.read(header[0])
+
+        if len(raw_bytes) < header[0]:
+            raise FBXSerializationException(f"Unable to deserialize bytes from data, expected {header[0]} bytes", raw_bytes)
+
+        return bytes(raw_bytes)
 
 
 class ListSerializer(Serializer):
@@ -151,137 +209,461 @@ class ListSerializer(Serializer):
             raise FBXSerializationException(
                 f"Invalid object specified for ListSerializer, object __subtype__ is None: {type(obj)}", obj)
 
-        if not loader.serializer_registry.__contains__(obj.__subtype__):
-            raise FBXSerializationException(f"No serializer registered for class {type(obj)}", obj)
-
-        serializer = loader.get_serializer(obj.__subtype__)
+        ignore_prefix = kwargs.get('ignore_prefix', True)
 
         serialized = b''
 
-        serialized += loader.serialize(len(obj))  # Length
-        serialized += loader.serialize(obj.encoding.value)  # Encoding
+        if not ignore_prefix:
+            if type(obj) not in type_codes:
+                raise FBXSerializationException(f"No type found in type_registry for array of type {type(obj)}", obj)
+
+            serialized += type_codes.get(type(obj))
+
+        compression_pool = kwargs.get('compression_pool')
+        compressed = compression_pool.get(obj) if compression_pool is not None else None
+
+        if compressed is not None:
+            encoding, serialized_list = FBXArrayEncoding.COMPRESSED, compressed
+        else:
+            serialized_list = self.serialize_payload(obj)
+            encoding = self.serialize_encoding(obj, serialized_list, **kwargs)
 
-        serialized_list = b''
+            if encoding == FBXArrayEncoding.COMPRESSED:
+                serialized_list = self.compress(obj, serialized_list, **kwargs)
 
-        for item in obj:
-            serialized_list += serializer.serialize(loader, item)
+        metrics = kwargs.get('metrics')
 
-        if obj.encoding == FBXArrayEncoding.COMPRESSED:
-            serialized_list = zlib.compress(serialized_list, level=zlib.Z_DEFAULT_COMPRESSION)
+        if metrics is not None:
+            metrics.record_array(type_codes.get(type(obj)), len(serialized_list), len(obj) * obj.__dtype__.itemsize)
 
-        serialized += loader.serialize(len(serialized_list))  # Bytes Length
+        serialized += array_header_codec.pack(len(obj), encoding.value, len(serialized_list))
         serialized += serialized_list
 
         return serialized
 
+    def serialize_encoding(self, obj: FBXArray, payload: bytes, **kwargs) -> FBXArrayEncoding:
+        # Arrays smaller than compression_threshold bytes are written uncompressed regardless of their encoding
+        if obj.encoding == FBXArrayEncoding.COMPRESSED and len(payload) >= kwargs.get('compression_threshold', 0):
+            return FBXArrayEncoding.COMPRESSED
+
+        return FBXArrayEncoding.UNCOMPRESSED
+
+    def compression_level(self, obj: FBXArray, **kwargs) -> int:
+        # compression_level is either a zlib level, or a mapping of array type to zlib level
+        level = kwargs.get('compression_level', zlib.Z_DEFAULT_COMPRESSION)
+
+        if isinstance(level, dict):
+            return level.get(obj.__array_type__, zlib.Z_DEFAULT_COMPRESSION)
+
+        return level
+
+    def compress(self, obj: FBXArray, payload: bytes, **kwargs) -> bytes:
+        try:
+            return zlib.compress(payload, level=self.compression_level(obj, **kwargs))
+        except zlib.error as e:
+            raise FBXSerializationException(f"Unable to compress {type(obj).__name__} payload", obj, e)
+
+    def serialize_payload(self, obj: FBXArray) -> bytes:
+        if obj.__subtype__ not in array_typecodes:
+            raise FBXSerializationException(f"No array packing typecode found for {type(obj)}", obj)
+
+        try:
+            if obj.wrapped:
+                return obj.numpy().astype(obj.__dtype__, copy=False).tobytes()
+
+            if obj.__subtype__ is bool:
+                return bytes(map(bool, list.__iter__(obj)))
+
+            return array.array(array_typecodes.get(obj.__subtype__), list.__iter__(obj)).tobytes()
+        except (TypeError, OverflowError) as e:
+            raise FBXSerializationException(f"Unable to pack {type(obj).__name__} values", obj, e)
+
     def deserialize(self, loader, cls, data, **kwargs) -> list:
         if not issubclass(cls, FBXArray):
             raise FBXSerializationException(f"Invalid FBX Type specified for ListSerializer: {cls}", data.read())
 
-        try:
-            length = loader.deserialize(data, int, **kwargs)
-            encoding = loader.deserialize(data, int, **kwargs)
-            bytes_length = loader.deserialize(data, int, **kwargs)
-        except struct.error as e:
-            raise FBXSerializationException("Unable to get list properties from data", data.read(), e)
-        except FBXSerializationException as fbxex:
-            raise FBXSerializationException("Unable to get list properties from data", cause=fbxex)
+        header = read_struct(data, array_header_codec)
 
-        arr = []
-        if encoding:
-            buffer = data.read(bytes_length)
-            decompressed = zlib.decompress(buffer)
-            raw_data = io.BytesIO(decompressed)
+        if header is None:
+            raise FBXSerializationException("Unable to get list properties from data", data.read())
+
+        length, encoding, bytes_length = header
+
+        encoding = FBXArrayEncoding.COMPRESSED if encoding else FBXArrayEncoding.UNCOMPRESSED
+
+        if cls.__dtype__ is None:
+            raise FBXSerializationException(f"No element dtype declared for {cls}", data.read())
+
+        metrics = kwargs.get('metrics')
+
+        if metrics is not None:
+            metrics.record_array(type_codes.get(cls), bytes_length, length * cls.__dtype__.itemsize)
+
+        if kwargs.get('defer_arrays', False):
+            # Only the payload's location is kept, it is decoded when the array is first accessed
+            handle = FBXArrayHandle(data, data.tell(), length, encoding, bytes_length, cls.__dtype__)
+            data.seek(bytes_length, io.SEEK_CUR)
+
+            return cls.defer(handle, encoding=encoding)
+
+        decompress_pool = kwargs.get('decompress_pool')
+
+        if encoding and decompress_pool is not None:
+            return decompress_pool.submit(cls, data.read(bytes_length), length, kwargs.get('use_numpy', False))
 
-            while raw_data.tell() < len(decompressed):
-                arr.append(loader.deserialize(raw_data, cls.__subtype__, **kwargs))
+        arr = self.deserialize_ndarray(cls, data, length, encoding, bytes_length)
+
+        if not kwargs.get('use_numpy', False):
+            arr._materialize()
+
+        return arr
+
+    def deserialize_ndarray(self, cls, data, length: int, encoding: FBXArrayEncoding, bytes_length: int):
+        if encoding:
+            try:
+                payload = zlib.decompress(data.read(bytes_length))
+            except zlib.error as e:
+                raise FBXSerializationException(f"Unable to decompress {cls.__name__} payload", cause=e)
         else:
-            for i in range(0, length):
-                arr.append(loader.deserialize(data, cls.__subtype__, **kwargs))
+            payload = data.read(length * cls.__dtype__.itemsize)
+
+        try:
+            ndarray = numpy.frombuffer(payload, dtype=cls.__dtype__, count=length)
+        except ValueError as e:
+            raise FBXSerializationException(
+                f"Expected {length} elements for {cls.__name__}, payload is only {len(payload)} bytes", cause=e)
+
+        return cls.wrap(ndarray, encoding=encoding)
+
+
+class FBXNodeFilter(object):
+    # Include/exclude patterns over node paths such as "Objects/Geometry/Vertices", each segment may use fnmatch
+    # wildcards. Excluded names without a "/" match at any depth, included ones name top level sections. Nodes outside
+    # the include patterns (and not on the way to one) are skipped by seeking past them.
+    SKIP = 0
+    INCLUDE = 1  # Keep the node, its children still need checking
+    ALL = 2  # Keep the node and its whole subtree
+
+    def __init__(self, include=None, exclude=None):
+        self.include = [self.split(pattern) for pattern in include] if include is not None else None
+        self.exclude = [self.split(pattern) for pattern in exclude or ()]
+
+    @staticmethod
+    def split(pattern):
+        return tuple(pattern.split('/')) if isinstance(pattern, str) else tuple(pattern)
+
+    @staticmethod
+    def matches(path: tuple, pattern: tuple):
+        return all(fnmatch.fnmatchcase(name, segment) for name, segment in zip(path, pattern))
+
+    def match(self, path: tuple):
+        for pattern in self.exclude:
+            if len(pattern) == 1:
+                if fnmatch.fnmatchcase(path[-1], pattern[0]):
+                    return self.SKIP
+            elif len(path) == len(pattern) and self.matches(path, pattern):
+                return self.SKIP
+
+        kept = self.INCLUDE if self.exclude else self.ALL
+
+        if self.include is None:
+            return kept
+
+        state = self.SKIP
+
+        for pattern in self.include:
+            if self.matches(path, pattern):
+                if len(path) >= len(pattern):
+                    return kept
+
+                state = self.INCLUDE  # An ancestor of an included path
+
+        return state
+
+
+class FBXCompressionPool(object):
+    # Packs and compresses every array in a tree on a thread pool up front, so the node bytes can be assembled while
+    # the larger arrays are still being compressed
+    def __init__(self, workers: int, list_serializer: ListSerializer, **kwargs):
+        # Only imported once a pool is used, it is not needed for plain reads and writes
+        import concurrent.futures
+
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pyfbx-zlib')
+        self.list_serializer = list_serializer
+        self.kwargs = kwargs
+        self.pending = {}
+
+    def submit_tree(self, loader, root: FBXNode):
+        nodes = [root]
+
+        while nodes:
+            node = nodes.pop()
+
+            if isinstance(node, FBXLazyNode):
+                node = node.load()
+
+            values = getattr(node, '_value', None)
+
+            for value in values if isinstance(values, list) else [values]:
+                if isinstance(value, FBXArray) and value.encoding == FBXArrayEncoding.COMPRESSED:
+                    self.submit(value)
+
+            nodes.extend(loader.get_serializer(type(node)).iter_children(node))
+
+    def submit(self, obj: FBXArray):
+        if id(obj) not in self.pending:
+            self.pending[id(obj)] = (obj, self.executor.submit(self._compress, obj))
+
+    def _compress(self, obj: FBXArray):
+        payload = self.list_serializer.serialize_payload(obj)
+
+        if self.list_serializer.serialize_encoding(obj, payload, **self.kwargs) != FBXArrayEncoding.COMPRESSED:
+            return None
+
+        return self.list_serializer.compress(obj, payload, **self.kwargs)
+
+    def get(self, obj: FBXArray):
+        # Results are handed over once, so written payloads are not kept alive for the rest of the export
+        pending = self.pending.get(id(obj))
+
+        if pending is None or pending[0] is not obj:
+            return None
+
+        del self.pending[id(obj)]
+
+        return pending[1].result()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class FBXDecompressionPool(object):
+    # Compressed array payloads are handed to a thread pool as the parser meets them (zlib releases the GIL while
+    # inflating), the returned arrays stay empty until resolve() fills them in
+    def __init__(self, workers: int):
+        # Only imported once a pool is used, it is not needed for plain reads and writes
+        import concurrent.futures
+
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pyfbx-zlib')
+        self.pending = []
+
+    def submit(self, cls, payload, length: int, use_numpy: bool = False) -> FBXArray:
+        arr = cls.__view__(encoding=FBXArrayEncoding.COMPRESSED)
+
+        self.pending.append((arr, self.executor.submit(zlib.decompress, payload), length, use_numpy))
 
         return arr
 
+    def resolve(self):
+        pending, self.pending = self.pending, []
+
+        for arr, future, length, use_numpy in pending:
+            try:
+                payload = future.result()
+                arr._ndarray = numpy.frombuffer(payload, dtype=arr.__dtype__, count=length)
+            except zlib.error as e:
+                raise FBXSerializationException(f"Unable to decompress {type(arr).__name__} payload", cause=e)
+            except ValueError as e:
+                raise FBXSerializationException(f"Expected {length} elements for {type(arr).__name__}", cause=e)
+
+            if not use_numpy:
+                arr._materialize()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
 
 class FBXNodeSerializer(Serializer):
+    NODE_HEADER_SIZE = 24
+
     def serialize(self, loader, obj: FBXNode, **kwargs):
-        properties = self.serialize_property(loader, obj, **kwargs)
+        if isinstance(obj, FBXLazyNode):
+            return loader.serialize(obj.load(), **kwargs)
+
+        metrics, tracer = kwargs.get('metrics'), kwargs.get('tracer')
+
+        if metrics is None and tracer is None:
+            return self.serialize_node(loader, obj, **kwargs)
+
+        offset = kwargs.get('position', 0)
+        start, span = time.perf_counter(), tracer.begin('serialize', offset) if tracer is not None else None
+
+        serialized = self.serialize_node(loader, obj, **kwargs)
+        self.record_span(metrics, tracer, span, 'serialize', obj._name, offset, len(serialized), start)
+
+        return serialized
 
-        children = self.serialize_children(loader, obj, **kwargs)
+    def serialize_node(self, loader, obj: FBXNode, **kwargs):
+        # End offsets are absolute, so track where in the output this node is being written
+        position = kwargs.pop('position', 0)
+
+        properties = self.serialize_property(loader, obj, **kwargs)
         name = self.serialize_name(loader, obj, **kwargs)
 
+        children = self.serialize_children(
+            loader, obj, position=position + self.NODE_HEADER_SIZE + len(name) + len(properties), **kwargs)
+
+        body = self.serialize_node_body(loader, obj, properties, **kwargs)
+        end = position + 8 + len(body) + len(name) + len(properties) + len(children)
+
+        return b''.join((codecs[b'L'].pack(end), body, name, properties, children))
+
+    def serialize_node_body(self, loader, obj: FBXNode, properties: bytes, **kwargs):
         if obj.properties:
-            num_properties = loader.serialize(long(len(obj._value)), **kwargs)
+            num_properties = len(obj._value)
         else:
-            num_properties = loader.serialize(long(1 if obj._value is not None else 0), **kwargs)
+            num_properties = 1 if obj._value is not None else 0
 
-        num_properties_bytes = loader.serialize(long(len(properties)), **kwargs)
+        return node_body_codec.pack(num_properties, len(properties))
 
-        serialized = num_properties + num_properties_bytes + name + properties + children
+    def write(self, loader, obj: FBXNode, stream, **kwargs):
+        if isinstance(obj, FBXLazyNode):
+            obj = obj.load()
 
-        bytes_offset = loader.serialize(long(len(serialized)), **kwargs)
+        metrics, tracer = kwargs.get('metrics'), kwargs.get('tracer')
 
-        return bytes_offset + serialized
+        if metrics is None and tracer is None:
+            return self.write_node(loader, obj, stream, **kwargs)
 
-    def serialize_name(self, loader, obj: FBXNode, **kwargs):
-        serialized = b''
+        offset = stream.tell()
+        start, span = time.perf_counter(), tracer.begin('serialize', offset) if tracer is not None else None
+
+        self.write_node(loader, obj, stream, **kwargs)
+        self.record_span(metrics, tracer, span, 'serialize', obj._name, offset, stream.tell() - offset, start)
+
+    def write_node(self, loader, obj: FBXNode, stream, **kwargs):
+        # Streams the node straight to a seekable output, the end offset is back-patched once the children are written
+        start = stream.tell()
+
+        properties = self.serialize_property(loader, obj, **kwargs)
+        name = self.serialize_name(loader, obj, **kwargs)
+
+        stream.write(b'\x00' * 8)
+        stream.write(self.serialize_node_body(loader, obj, properties, **kwargs))
+        stream.write(name)
+        stream.write(properties)
+
+        del properties
+
+        self.write_children(loader, obj, stream, **kwargs)
+
+        end = stream.tell()
+
+        stream.seek(start)
+        stream.write(codecs[b'L'].pack(end))
+        stream.seek(end)
+
+    def write_children(self, loader, obj: FBXNode, stream, **kwargs):
+        for child in self.iter_children(obj):
+            loader.get_serializer(type(child)).write(loader, child, stream, **kwargs)
+
+    def iter_children(self, obj: FBXNode):
+        if isinstance(obj, list):
+            for child in obj:
+                if isinstance(child, (FBXNode, FBXCompactNode)):
+                    yield child
+
+        for child in obj.__dict__.values():
+            if isinstance(child, (FBXNode, FBXCompactNode)):
+                yield child
 
+    def serialize_name(self, loader, obj: FBXNode, **kwargs):
         if not isinstance(obj, FBXNode) and type_registry.contains(type(obj)):
             name = obj.__class__.__name__
         else:
             name = obj._name if obj._name else ""
 
-        length = len(obj._name)
+        encoded = bytes(name, 'utf8')
 
-        if length < 1:
+        if len(encoded) < 1:
             raise FBXSerializationException("FBX Node name cannot be empty!", obj)
 
-        serialized += struct.pack('B', length)
-        serialized += struct.pack(f"{length}s", bytes(name, 'utf8'))
-
-        return serialized
+        try:
+            return uint8_codec.pack(len(encoded)) + encoded
+        except struct.error as e:
+            raise FBXSerializationException(f"FBX Node name {name} is longer than 255 bytes", obj, e)
 
     def serialize_property(self, loader, obj: FBXNode, **kwargs):
-        serialized = b''
+        if not hasattr(obj, "properties") or obj.properties is None:
+            return b''
 
-        if hasattr(obj, "properties") and obj.properties is not None:
-            if isinstance(obj._value, list):
-                for value_ in obj._value:
-                    serialized += loader.serialize(value_, ignore_prefix=False)
-            else:
-                serialized += loader.serialize(obj._value, ignore_prefix=False)
+        return self.serialize_values(loader, obj._value if isinstance(obj._value, list) else [obj._value], **kwargs)
 
-        return serialized
+    def serialize_values(self, loader, values, **kwargs):
+        property_kwargs = {**kwargs, 'ignore_prefix': False}
+        metrics = kwargs.get('metrics')
 
-    def _serialize_child(self, loader, child, **kwargs):
-        if isinstance(child, FBXNode):
-            return loader.serialize(child, **kwargs)
+        if metrics is None:
+            return b''.join(loader.serialize(value_, **property_kwargs) for value_ in values)
 
-        return b''
+        serialized = []
+        for value_ in values:
+            start = time.perf_counter()
+            serialized.append(loader.serialize(value_, **property_kwargs))
 
-    def serialize_children(self, loader, obj: FBXNode, **kwargs):
-        serialized = b''
+            code = type_codes.get(type(value_))
 
-        if isinstance(obj, list):
-            for child in obj:
-                serialized += self._serialize_child(loader, child, **kwargs)
+            if code is not None:
+                metrics.record_property(code, len(serialized[-1]), time.perf_counter() - start)
 
-        for child in obj.__dict__.values():
-            serialized += self._serialize_child(loader, child, **kwargs)
+        return b''.join(serialized)
 
-        return serialized
+    def serialize_children(self, loader, obj: FBXNode, **kwargs):
+        position = kwargs.pop('position', 0)
+        serialized = []
+
+        for child in self.iter_children(obj):
+            serialized.append(loader.serialize(child, position=position, **kwargs))
+            position += len(serialized[-1])
+
+        return b''.join(serialized)
 
     def deserialize(self, loader, cls, data, **kwargs):
-        offset, properties, properties_len = self.deserialize_node_body(loader, data, **kwargs)
-        name = self.deserialize_name(data, **kwargs)
+        metrics, tracer = kwargs.get('metrics'), kwargs.get('tracer')
+
+        if metrics is None and tracer is None:
+            return self.deserialize_node(loader, cls, data, **kwargs)
+
+        offset = data.tell()
+        start, span = time.perf_counter(), tracer.begin('deserialize', offset) if tracer is not None else None
+
+        node = self.deserialize_node(loader, cls, data, **kwargs)
+
+        # Skipped (filtered) nodes and the empty end of list markers are not recorded
+        if node is not None and node._name:
+            self.record_span(metrics, tracer, span, 'deserialize', node._name, offset, data.tell() - offset, start)
+
+        return node
+
+    def record_span(self, metrics, tracer, span, category: str, name: str, offset: int, size: int, start: float):
+        if metrics is not None:
+            metrics.record_node(name, size, time.perf_counter() - start)
+
+        if tracer is not None:
+            tracer.end(span, category, name, offset, size)
+
+    def deserialize_node(self, loader, cls, data, **kwargs):
+        if kwargs.get('compact', False):
+            return loader.get_serializer(FBXCompactNode).deserialize_node(loader, FBXCompactNode, data, **kwargs)
+
+        offset, properties, properties_len, name = self.deserialize_node_header(data, **kwargs)
+
+        if name and kwargs.get('node_filter') is not None:
+            kwargs = self.filter_node(data, name, offset, **kwargs)
+
+            if kwargs is None:
+                return None
 
         cls = type_registry.get(name) if type_registry.contains(name) else cls
 
         values = []
         if properties and properties_len:
             pos = data.tell()
+            deserialize_property = self.property_deserializer(**kwargs)
+            decoders = property_decoders_for(loader)
 
             while data.tell() - pos < properties_len:
-                values.append(self.deserialize_property(loader, data, **kwargs))
+                values.append(deserialize_property(loader, data, decoders, **kwargs))
 
         node = cls()
         node._value = values
@@ -291,26 +673,57 @@ class FBXNodeSerializer(Serializer):
             child = self.deserialize_child(loader, data, **kwargs)
             self.add_child(node, child, **kwargs)
 
-        log.debug(
-            f"Parsed Node {name}({values}): Offset: {offset}, Properties: {properties}, Properties Len: {properties_len}, Children: {node.__dict__}")
-
         return node
 
     def deserialize_child(self, loader, data, **kwargs):
         child = loader.deserialize(data, FBXNode, **kwargs)
 
-        if not child._name:
+        if child is None or not child._name:
             return None
 
         return child
 
-    def add_child(self, node, child: FBXNode, **kwargs):
-        node_definition = class_registry.get(type(node))
+    def filter_node(self, data, name: str, offset: int, **kwargs):
+        # Returns the kwargs to parse the node's children with, or None once the node has been skipped
+        node_filter = kwargs['node_filter']
+        path = kwargs.get('node_path', ()) + (name,)
+
+        state = node_filter.match(path)
+
+        if state == FBXNodeFilter.SKIP:
+            data.seek(offset)
+            return None
+
+        if state == FBXNodeFilter.ALL:
+            kwargs.pop('node_filter')
+            kwargs.pop('node_path', None)
+        else:
+            kwargs['node_path'] = path
+
+        return kwargs
+
+    def deserialize_lazy_child(self, loader, data, **kwargs):
+        start = data.tell()
+
+        offset, properties, properties_len, name = self.deserialize_node_header(data, **kwargs)
 
+        if not name:
+            return None
+
+        if kwargs.get('node_filter') is not None and self.filter_node(data, name, offset, **kwargs) is None:
+            return None
+
+        data.seek(offset)
+
+        return FBXLazyNode(name, loader, data, start, offset, **kwargs)
+
+    def add_child(self, node, child: FBXNode, **kwargs):
         if child is None:
             return
 
-        if not node_definition.aliases.contains(child._name):
+        child_name = child_aliases(type(node)).get(child._name)
+
+        if child_name is None:
             if isinstance(node, list):
                 node.append(child)
                 return
@@ -319,14 +732,29 @@ class FBXNodeSerializer(Serializer):
                 return
 
             child_name = child._name
-        else:
-            child_name = node_definition.aliases.get(child._name)
 
-        setattr(node, child_name, child)
+        attach_child(node, child_name, child)
+
+    def property_deserializer(self, **kwargs):
+        return self.deserialize_property if kwargs.get('metrics') is None else self.deserialize_measured_property
 
-    def deserialize_property(self, loader, data, **kwargs):
-        binary_type = data.read(1)
+    def deserialize_measured_property(self, loader, data, decoders: dict = None, **kwargs):
+        start, position = time.perf_counter(), data.tell()
+        binary_type = bytes(self.peek_type(data))
 
+        value = self.deserialize_property(loader, data, decoders, **kwargs)
+        kwargs['metrics'].record_property(binary_type, data.tell() - position, time.perf_counter() - start)
+
+        return value
+
+    def deserialize_property(self, loader, data, decoders: dict = None, **kwargs):
+        binary_type = bytes(data.read(1))
+        decoder = (decoders if decoders is not None else property_decoders_for(loader)).get(binary_type)
+
+        if decoder is not None:
+            return decoder(loader, data, **kwargs)
+
+        # Type codes registered at runtime still go through the registry and loader
         if not type_registry.contains(binary_type):
             raise FBXSerializationException(f"Unknown FBX binary type ID detected, {binary_type}", data.read())
 
@@ -335,12 +763,22 @@ class FBXNodeSerializer(Serializer):
 
         return real_value
 
-    def deserialize_node_body(self, loader, data, **kwargs):
-        offset = loader.deserialize(data, long, **kwargs)
-        properties = loader.deserialize(data, long, **kwargs)
-        properties_len = loader.deserialize(data, long, **kwargs)
+    def deserialize_node_header(self, data, **kwargs):
+        header = read_struct(data, node_header_codec)
+
+        if header is None:
+            raise FBXSerializationException("Unable to parse node header from data", data.read())
 
-        return offset, properties, properties_len
+        offset, properties, properties_len, name_length = header
+        name = data.read(name_length)
+
+        if len(name) < name_length:
+            raise FBXSerializationException("Unable to parse name from data", name)
+
+        try:
+            return offset, properties, properties_len, str(name, 'utf-8')
+        except UnicodeDecodeError as e:
+            raise FBXSerializationException("Unable to parse name from data", name, e)
 
     def peek(self, data, num_bytes):
         position = data.tell()
@@ -350,14 +788,6 @@ class FBXNodeSerializer(Serializer):
 
         return read_bytes
 
-    def deserialize_name(self, data, **kwargs):
-        try:
-            length = struct.unpack('B', data.read(1))[0]
-
-            return struct.unpack(f"{length}s", data.read(length))[0].decode('utf-8')
-        except struct.error as e:
-            raise FBXSerializationException("Unable to parse name from data", data.read(), e)
-
     def peek_name(self, data):
         try:
             length = struct.unpack('b', self.peek(data, 1))[0]
@@ -375,6 +805,73 @@ class FBXNodeSerializer(Serializer):
         return self.peek(data, 1)
 
 
+class FBXCompactNodeSerializer(FBXNodeSerializer):
+    def serialize_node_body(self, loader, obj: FBXCompactNode, properties: bytes, **kwargs):
+        return node_body_codec.pack(len(obj.properties), len(properties))
+
+    def serialize_name(self, loader, obj: FBXCompactNode, **kwargs):
+        encoded = bytes(obj._name, 'utf8')
+
+        if len(encoded) < 1:
+            raise FBXSerializationException("FBX Node name cannot be empty!", obj)
+
+        try:
+            return uint8_codec.pack(len(encoded)) + encoded
+        except struct.error as e:
+            raise FBXSerializationException(f"FBX Node name {obj._name} is longer than 255 bytes", obj, e)
+
+    def serialize_property(self, loader, obj: FBXCompactNode, **kwargs):
+        return self.serialize_values(loader, obj.properties, **kwargs)
+
+    def iter_children(self, obj: FBXCompactNode):
+        return iter(obj.children)
+
+    def deserialize_node(self, loader, cls, data, **kwargs):
+        offset, properties, properties_len, name = self.deserialize_node_header(data, **kwargs)
+
+        if name and kwargs.get('node_filter') is not None:
+            kwargs = self.filter_node(data, name, offset, **kwargs)
+
+            if kwargs is None:
+                return None
+
+        values = ()
+        if properties and properties_len:
+            end = data.tell() + properties_len
+            values = []
+            deserialize_property = self.property_deserializer(**kwargs)
+            decoders = property_decoders_for(loader)
+
+            while data.tell() < end:
+                values.append(deserialize_property(loader, data, decoders, **kwargs))
+
+        children = None
+        while offset - data.tell() > 0:
+            child = self.deserialize(loader, cls, data, **kwargs)
+
+            if child is not None and child._name:
+                if children is None:
+                    children = []
+
+                children.append(child)
+
+        return FBXCompactNode(name, values, children)
+
+    def expand(self, loader, obj: FBXCompactNode):
+        node_serializer = loader.get_serializer(FBXNode)
+
+        cls = type_registry.get(obj._name) if type_registry.contains(obj._name) else FBXNode
+
+        node = cls()
+        node._value = list(obj.properties)
+        node._name = obj._name
+
+        for child in obj.children:
+            node_serializer.add_child(node, self.expand(loader, child))
+
+        return node
+
+
 class FBXFileSerializer(FBXNodeSerializer):
     FBX_META_HEADER = b'Kaydara FBX Binary  \x00\x1A\x00'
 
@@ -384,35 +881,241 @@ class FBXFileSerializer(FBXNodeSerializer):
         serialized = b''
 
         serialized += self.FBX_META_HEADER
-        serialized += loader.serialize(obj.fbx_header_extension.fbx_version, ignore_prefix=True)
-        serialized += self.serialize_children(loader, obj, **kwargs)
+        serialized += loader.serialize(self.file_version(obj), ignore_prefix=True)
+
+        compression_pool = self.start_compression(loader, obj, **kwargs)
+
+        try:
+            if compression_pool is not None:
+                kwargs['compression_pool'] = compression_pool
+
+            serialized += self.serialize_children(loader, obj, position=len(serialized), **kwargs)
+        finally:
+            if compression_pool is not None:
+                compression_pool.shutdown()
 
         serialized += b'\x00' * self.EMPTY_NODE_SIZE * 7
 
         return serialized
 
+    def write(self, loader, obj: FBXFile, stream, **kwargs):
+        if not stream.seekable():
+            raise FBXSerializationException("Streaming an FBX File requires a seekable output", stream)
+
+        stream.write(self.FBX_META_HEADER)
+        stream.write(loader.serialize(self.file_version(obj), ignore_prefix=True))
+
+        compression_pool = self.start_compression(loader, obj, **kwargs)
+
+        try:
+            if compression_pool is not None:
+                kwargs['compression_pool'] = compression_pool
+
+            self.write_children(loader, obj, stream, **kwargs)
+        finally:
+            if compression_pool is not None:
+                compression_pool.shutdown()
+
+        stream.write(b'\x00' * self.EMPTY_NODE_SIZE * 7)
+
+    def file_version(self, obj: FBXFile) -> int:
+        header = obj.fbx_header_extension
+
+        # Parsed files carry the version as an FBXVersion child node rather than a plain value
+        if isinstance(header, FBXCompactNode):
+            version = header.find('FBXVersion')
+        else:
+            version = header.fbx_version
+
+        if isinstance(version, (FBXNode, FBXCompactNode)):
+            version = version._value[0] if version._value else None
+
+        if not isinstance(version, int):
+            raise FBXSerializationException("FBX File is missing its FBXHeaderExtension FBXVersion", obj)
+
+        return version
+
+    def start_compression(self, loader, obj: FBXFile, **kwargs):
+        compress_workers = kwargs.pop('compress_workers', None)
+
+        if not compress_workers:
+            return None
+
+        compression_pool = FBXCompressionPool(compress_workers, loader.get_serializer(FBXArray), **kwargs)
+        compression_pool.submit_tree(loader, obj)
+
+        return compression_pool
+
     def deserialize(self, loader, cls, data, **kwargs):
+        if kwargs.pop('memory_map', False) and not isinstance(data, FBXMappedStream):
+            try:
+                mapped = FBXMappedStream.from_file(data)
+            except FBXSerializationException:
+                return self.deserialize(loader, cls, data, **kwargs)  # Unmappable streams are read as they are
+
+            try:
+                file = self.deserialize(loader, cls, mapped, **kwargs)
+            except BaseException:
+                mapped.close()
+                raise
+
+            # Lazy nodes and deferred arrays keep reading from the mapping, an eager parse is done with it
+            if not kwargs.get('lazy', False) and not kwargs.get('defer_arrays', False):
+                mapped.close()
+
+            return file
+
+        header_version = self.deserialize_header(loader, data, **kwargs)
+
+        file_size = self.stream_size(data)
+
+        # Top level nodes are only located, and parsed when first accessed
+        lazy = kwargs.pop('lazy', False)
+
+        include, exclude = kwargs.pop('include', None), kwargs.pop('exclude', None)
+
+        if include is not None or exclude is not None:
+            kwargs['node_filter'] = FBXNodeFilter(include, exclude)
+
+        decompress_workers = kwargs.pop('decompress_workers', None)
+        decompress_pool = FBXDecompressionPool(decompress_workers) if decompress_workers and not lazy else None
+
+        file = FBXFile()
+        try:
+            while file_size - data.tell() > self.EMPTY_NODE_SIZE * 7:
+                try:
+                    if lazy:
+                        child = self.deserialize_lazy_child(loader, data, **kwargs)
+                    elif decompress_pool is not None:
+                        child = self.deserialize_child(loader, data, decompress_pool=decompress_pool, **kwargs)
+                    else:
+                        child = self.deserialize_child(loader, data, **kwargs)
+
+                    self.add_child(file, child)
+                except Exception as e:
+                    raise FBXSerializationException("Unable to parse FBX File from data", data.read(), e)
+
+            if decompress_pool is not None:
+                decompress_pool.resolve()
+        finally:
+            if decompress_pool is not None:
+                decompress_pool.shutdown()
+
+        return file
+
+    def deserialize_header(self, loader, data, **kwargs):
         meta_header = struct.unpack(f'{len(self.FBX_META_HEADER)}s', data.read(len(self.FBX_META_HEADER)))[0]
 
         if meta_header != self.FBX_META_HEADER:
             raise FBXValidationException(f"Invalid FBX Binary specified, malformed header",
                                          meta_header + data.read())
 
-        header_version = loader.deserialize(data, int, **kwargs)
+        version = read_struct(data, codecs[b'I'])
 
-        if hasattr(data, "name") and data._name:
-            file_size = os.path.getsize(data._name)
-        else:
-            data.read()
-            file_size = data.tell()
-            data.seek(0)
+        if version is None:
+            raise FBXValidationException("Invalid FBX Binary specified, missing version", meta_header)
 
-        file = FBXFile()
-        while file_size - data.tell() > self.EMPTY_NODE_SIZE * 7:
-            try:
-                child = self.deserialize_child(loader, data, **kwargs)
-                self.add_child(file, child)
-            except Exception as e:
-                raise FBXSerializationException("Unable to parse FBX File from data", data.read(), e)
+        return version[0]
 
-        return file
+    def stream_size(self, data):
+        if isinstance(data, FBXMappedStream):
+            return len(data)
+
+        position = data.tell()
+        size = data.seek(0, io.SEEK_END)
+        data.seek(position)
+
+        return size
+
+
+# Alias and attribute lookups for child attachment are resolved once per class rather than through the synchronized
+# class registry for every child, classes registered with pybran after their first parse must be removed from here
+node_aliases = {}
+node_attributes = {}
+
+
+def child_aliases(cls: type) -> dict:
+    aliases = node_aliases.get(cls)
+
+    if aliases is None:
+        aliases = node_aliases[cls] = dict(class_registry.get(cls).aliases.items())
+
+    return aliases
+
+
+def attach_child(node, name: str, child):
+    cls = type(node)
+    direct = node_attributes.get((cls, name))
+
+    if direct is None:
+        # Descriptors (e.g. fields bound to properties) and custom __setattr__ overrides still go through setattr
+        direct = node_attributes[(cls, name)] = cls.__setattr__ is FBXObject.__setattr__ and \
+            not hasattr(type(getattr(cls, name, None)), '__set__')
+
+    if direct:
+        node.__dict__[name] = child
+
+        if isinstance(child, FBXObject):
+            node.__dict__.setdefault('__children__', set()).add(name)
+    else:
+        setattr(node, name, child)
+
+
+def primitive_decoder(cls: type, codec: struct.Struct):
+    if cls in (int, float, bool):
+        def decode(loader, data, **kwargs):
+            values = read_struct(data, codec)
+
+            return cls() if values is None else values[0]
+    else:
+        def decode(loader, data, **kwargs):
+            values = read_struct(data, codec)
+
+            return cls() if values is None else cls(values[0])
+
+    return decode
+
+
+def serializer_decoder(serializer: Serializer, cls: type):
+    def decode(loader, data, **kwargs):
+        return serializer.deserialize(loader, cls, data, **kwargs)
+
+    return decode
+
+
+array_types = {type_codes.get(cls): cls for cls in (FloatArray, DoubleArray, LongArray, IntArray, BoolArray)}
+
+# FBX binary type code -> decoder(loader, data, **kwargs), used in place of type_registry lookups for properties
+property_decoders = {code: primitive_decoder(cls, primitive_codecs.get(cls))
+                     for cls, code in type_codes.items() if code in codecs}
+property_decoders[type_codes.get(str)] = serializer_decoder(StringSerializer(), str)
+property_decoders[type_codes.get(bytes)] = serializer_decoder(BytesSerializer(), bytes)
+property_decoders.update({code: serializer_decoder(ListSerializer(), cls) for code, cls in array_types.items()})
+
+# Property type -> the serializer its entry in property_decoders stands in for
+property_serializers = {cls: PrimitiveSerializer for cls, code in type_codes.items() if code in codecs}
+property_serializers.update({str: StringSerializer, bytes: BytesSerializer})
+property_serializers.update({cls: ListSerializer for cls in array_types.values()})
+
+
+def property_decoders_for(loader) -> dict:
+    # FBXLoader keeps the resolved table until a serializer is registered, plain pybran loaders resolve it every time
+    decoders = getattr(loader, 'property_decoders', None)
+
+    return decoders if decoders is not None else resolve_property_decoders(loader)
+
+
+def resolve_property_decoders(loader) -> dict:
+    # Property types with another serializer registered on the loader are decoded through the loader's serializer
+    registry = loader.serializer_registry
+    overrides = [cls for cls, default in property_serializers.items() if registry.get(cls, default) is not default]
+
+    if not overrides:
+        return property_decoders
+
+    decoders = dict(property_decoders)
+
+    for cls in overrides:
+        decoders[type_codes.get(cls)] = serializer_decoder(loader.get_serializer(cls), cls)
+
+    return decoders
@@ -0,0 +1,115 @@
+import zlib
+
+import numpy
+
+from pybran.decorators import type_registry
+
+from pyfbx.core import FBXFile
+from pyfbx.core.common import FBXArrayEncoding
+from pyfbx.core.events import FBXEmitter, FBXEventHandler, FBXStreamEvent, FBXNodeStartEvent, FBXArrayEvent, \
+    FBXNodeEndEvent
+from pyfbx.exceptions import FBXSerializationException
+from pyfbx.io import FBXMappedStream
+from pyfbx.serializers import FBXFileSerializer, read_struct, array_header_codec, array_types, property_decoders_for
+
+
+class FBXStreamParser(FBXEmitter):
+    # Walks an FBX binary record by record and emits events for each node rather than building a tree. Only the
+    # header of the node currently being read and the end offsets of its open ancestors are held in memory.
+    def __init__(self, loader, *handlers: FBXEventHandler):
+        super().__init__(set(handlers), FBXStreamEvent)
+
+        self.loader = loader
+        self.serializer: FBXFileSerializer = loader.get_serializer(FBXFile)
+
+    def read(self, path: str, memory_map: bool = True, **kwargs):
+        with open(path, 'rb') as file:
+            data = FBXMappedStream.from_file(file) if memory_map else file
+
+            try:
+                self.parse(data, **kwargs)
+            finally:
+                if memory_map:
+                    data.close()
+
+    def parse(self, data, **kwargs):
+        loader = self.loader
+        serializer = self.serializer
+
+        serializer.deserialize_header(loader, data, **kwargs)
+
+        file_size = serializer.stream_size(data)
+        footer_size = serializer.EMPTY_NODE_SIZE * 7
+
+        open_nodes = []
+        decoders = property_decoders_for(loader)
+
+        while True:
+            position = data.tell()
+
+            while open_nodes and position >= open_nodes[-1][1]:
+                name, end = open_nodes.pop()
+                self.emit(FBXNodeEndEvent(name, end))
+
+            if not open_nodes and file_size - position <= footer_size:
+                break
+
+            end, num_properties, properties_len, name = serializer.deserialize_node_header(data, **kwargs)
+
+            if not name:
+                continue  # Null record terminating a child list
+
+            properties, arrays = self.parse_properties(data, data.tell() + properties_len, decoders, **kwargs)
+
+            self.emit(FBXNodeStartEvent(name, properties, position))
+
+            for array_type, length, encoding, payload in arrays:
+                ndarray = self.decode_array(array_type, length, encoding, payload)
+
+                self.emit(FBXArrayEvent(name, array_type.__dtype__, ndarray, position))
+
+            open_nodes.append((name, end))
+
+    def parse_properties(self, data, end: int, decoders: dict = None, **kwargs):
+        if decoders is None:
+            decoders = property_decoders_for(self.loader)
+
+        properties = []
+        arrays = []
+
+        while data.tell() < end:
+            binary_type = bytes(data.read(1))
+            array_type = array_types.get(binary_type)
+
+            if array_type is not None:
+                # Payloads are only decompressed once the node start has been emitted
+                header = read_struct(data, array_header_codec)
+
+                if header is None:
+                    raise FBXSerializationException(f"Unable to get {array_type.__name__} properties from data")
+
+                length, encoding, bytes_length = header
+
+                arrays.append((array_type, length, encoding, data.read(bytes_length)))
+                continue
+
+            decoder = decoders.get(binary_type)
+
+            if decoder is None:
+                if not type_registry.contains(binary_type):
+                    raise FBXSerializationException(f"Unknown FBX binary type ID detected, {binary_type}")
+
+                properties.append(self.loader.deserialize(data, type_registry.get(binary_type), **kwargs))
+            else:
+                properties.append(decoder(self.loader, data, **kwargs))
+
+        return properties, arrays
+
+    def decode_array(self, array_type: type, length: int, encoding: int, payload):
+        try:
+            if encoding == FBXArrayEncoding.COMPRESSED:
+                payload = zlib.decompress(payload)
+
+            return numpy.frombuffer(payload, dtype=array_type.__dtype__, count=length)
+        except (zlib.error, ValueError) as e:
+            raise FBXSerializationException(f"Unable to decode {array_type.__name__} payload", cause=e)
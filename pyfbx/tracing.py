@@ -0,0 +1,65 @@
+import json
+import os
+import threading
+import time
+
+
+# Opt-in span hook for the node serializers, passed as tracer= to loader.read/deserialize/serialize/write. Without a
+# tracer the serializers never call into here. begin() is called before a node is read or written, with its offset in
+# the stream, and end() once it is done with its name and size in bytes. Subclasses can override both to forward the
+# spans elsewhere, this implementation keeps them as Chrome trace events for chrome://tracing or ui.perfetto.dev.
+class FBXTracer(object):
+    def __init__(self, max_events: int = None):
+        self.max_events = max_events
+        self.events = []
+        self.dropped = 0
+
+        self.pid = os.getpid()
+        self.origin = time.perf_counter_ns()
+
+    def begin(self, category: str, offset: int):
+        return time.perf_counter_ns()
+
+    def end(self, span, category: str, name: str, offset: int, size: int):
+        if self.max_events is not None and len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+
+        now = time.perf_counter_ns()
+
+        # Complete ("X") events, the viewers nest them by their timestamps so no begin events need to be kept
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (span - self.origin) / 1000,
+            'dur': (now - span) / 1000,
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+            'args': {'offset': offset, 'size': size},
+        })
+
+    def clear(self):
+        self.events.clear()
+        self.dropped = 0
+
+    def to_chrome(self) -> dict:
+        return {
+            'traceEvents': self.events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'dropped': self.dropped},
+        }
+
+    def dump(self, path_or_stream):
+        if hasattr(path_or_stream, 'write'):
+            json.dump(self.to_chrome(), path_or_stream)
+            return
+
+        with open(path_or_stream, 'w') as stream:
+            json.dump(self.to_chrome(), stream)
+
+    def __len__(self):
+        return len(self.events)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self.events)} spans>"
@@ -0,0 +1,100 @@
+import logging
+import os
+import signal
+
+import pytest
+
+from test_fbx_file_serializer import build_file
+
+from pyfbx import loader, load_batch, load_file, expand_paths, FBXFile
+
+logger = logging.getLogger("tests")
+
+
+def count_objects(file: FBXFile):
+    return len(file.objects)
+
+
+def write_corpus(directory, count=4):
+    directory.mkdir()
+
+    for i in range(count):
+        (directory / f"model{i}.fbx").write_bytes(loader.serialize(build_file(models=i + 1)))
+
+    (directory / "broken.fbx").write_bytes(b"Kaydara FBX Binary  \x00\x1a\x00" + b"\xe8\x1c\x00\x00" + b"\xff" * 400)
+
+    return directory
+
+
+def test_expand_paths(tmp_path):
+    corpus = write_corpus(tmp_path / "corpus")
+
+    assert len(list(expand_paths(corpus))) == 5
+    assert len(list(expand_paths(str(corpus / "model*.fbx")))) == 4
+    assert list(expand_paths([str(corpus / "model0.fbx")])) == [str(corpus / "model0.fbx")]
+
+
+def test_load_batch(tmp_path):
+    corpus = write_corpus(tmp_path / "corpus")
+
+    results = {result.path: result for result in load_batch(corpus, workers=2, mapper=count_objects)}
+
+    assert len(results) == 5
+    assert results[str(corpus / "model2.fbx")].value == 6
+    assert all(result.ok for path, result in results.items() if "model" in path)
+
+    broken = results[str(corpus / "broken.fbx")]
+    assert not broken.ok and broken.value is None
+    assert "FBX" in broken.error
+
+
+def test_load_batch_files(tmp_path):
+    corpus = write_corpus(tmp_path / "corpus", count=1)
+
+    result, = load_batch([corpus / "model0.fbx"], workers=1, timeout=30)
+
+    assert isinstance(result.value, FBXFile)
+    assert result.value.connections[0]._value == ["OO", 1000, 2000]
+
+
+def exit_on_two_models(file: FBXFile):
+    # Simulates a worker being killed part way through the batch
+    if len(file.objects) == 4:
+        os._exit(1)
+
+    return len(file.objects)
+
+
+def test_load_batch_worker_crash(tmp_path):
+    corpus = write_corpus(tmp_path / "corpus", count=10)
+
+    results = {result.path: result for result in load_batch(corpus, workers=1, mapper=exit_on_two_models)}
+
+    # Files in flight with the crashing one fail with it, the pool is restarted for the rest
+    assert len(results) == 11
+    assert not results[str(corpus / "model1.fbx")].ok
+    assert results[str(corpus / "model9.fbx")].value == 20
+
+
+def test_timeout_without_sigalrm(tmp_path, monkeypatch):
+    corpus = write_corpus(tmp_path / "corpus", count=1)
+    monkeypatch.delattr(signal, 'setitimer')
+
+    with pytest.warns(RuntimeWarning):
+        result = load_file(str(corpus / "model0.fbx"), timeout=5)
+
+    assert result.ok
+
+
+def test_load_file_restores_sigalrm(tmp_path):
+    corpus = write_corpus(tmp_path / "corpus")
+    previous = signal.signal(signal.SIGALRM, signal.SIG_IGN)
+
+    try:
+        result = load_file(str(corpus / "model0.fbx"), count_objects, timeout=30)
+
+        assert result.ok and result.value == 2
+        assert signal.getsignal(signal.SIGALRM) is signal.SIG_IGN
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    finally:
+        signal.signal(signal.SIGALRM, previous)
@@ -0,0 +1,40 @@
+import json
+import logging
+from io import BytesIO
+
+from benchmarks.bench import run
+from benchmarks.corpus import CorpusConfig, generate
+
+from pyfbx import loader, FBXFile
+
+logger = logging.getLogger("tests")
+
+
+def test_synthetic_corpus():
+    config = CorpusConfig(objects=4, depth=3, properties=5, array_length=30, entropy=0.25)
+
+    deserialized = loader.deserialize(BytesIO(loader.serialize(generate(config))), FBXFile)
+
+    assert len(deserialized.objects) == 8
+    assert len(deserialized.objects[0].Vertices._value[0]) == 30
+    assert len(deserialized.objects[1].Properties70) == 5
+    assert deserialized.objects[1].Level0.Level1.Level2._value == [2, "Nested 2"]
+    assert len(deserialized.connections) == 8
+
+
+def test_compression_entropy():
+    compressible = loader.serialize(generate(CorpusConfig(objects=2, array_length=4096, entropy=0.0)))
+    random = loader.serialize(generate(CorpusConfig(objects=2, array_length=4096, entropy=1.0)))
+
+    assert len(compressible) * 4 < len(random)
+
+
+def test_benchmark_results():
+    results = run(CorpusConfig(objects=2, depth=1, properties=2, array_length=16), repeat=1)
+
+    assert json.loads(json.dumps(results))['config']['objects'] == 2
+    assert {(r['serializer'], r['operation']) for r in results['results']} == {
+        (serializer, operation) for serializer in ("FBXFileSerializer", "FBXNodeSerializer", "ListSerializer")
+        for operation in ("serialize", "deserialize")
+    }
+    assert all(r['peak_memory_bytes'] > 0 and r['min_seconds'] > 0 for r in results['results'])
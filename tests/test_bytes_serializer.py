@@ -36,3 +36,12 @@ def test_deserialize_empty_bytes():
 
     with pytest.raises(FBXSerializationException):
         bytes_serializer.deserialize(None, str, BytesIO(b''))
+
+
+def test_prefixed_bytes():
+    bytes_serializer = BytesSerializer()
+
+    serialized = bytes_serializer.serialize(None, b'\x00\x01', ignore_prefix=False)
+
+    assert serialized[:1] == b'R'
+    assert bytes_serializer.deserialize(None, bytes, BytesIO(serialized[1:])) == b'\x00\x01'
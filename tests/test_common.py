@@ -67,4 +67,33 @@ def test_property_template():
     serialized = loader.serialize(property_template)
     deserialized = loader.deserialize(BytesIO(serialized), PropertyTemplate)
 
-    assert deserialized == property_template
\ No newline at end of file
+    assert deserialized == property_template
+
+def test_properties_70_lookup():
+    properties70 = Properties70(
+        Property70("Lcl Translation", "Lcl Translation", "", "A", 1.0, 2.0, 3.0),
+        Property70("Visibility", "Visibility", "", "A", 1.0)
+    )
+
+    assert properties70.get("Lcl Translation") == (1.0, 2.0, 3.0)
+    assert properties70.get("Visibility") == 1.0
+    assert properties70.get("Missing", 0) == 0
+    assert "Visibility" in properties70
+
+    properties70.set("Visibility", 0.0)
+    properties70.set("Lcl Translation", (4.0, 5.0, 6.0))
+    properties70.set("DefaultAttributeIndex", 0)
+
+    assert properties70.find("Lcl Translation")._value == ["Lcl Translation", "Lcl Translation", "", "A", 4.0, 5.0, 6.0]
+    assert properties70.get("Visibility") == 0.0
+    assert properties70.find("DefaultAttributeIndex").type == "int"
+    assert [prop.name for prop in properties70] == ["Lcl Translation", "Visibility", "DefaultAttributeIndex"]
+
+    properties70.remove("Visibility")
+    assert "Visibility" not in properties70
+    assert list(properties70.names()) == ["Lcl Translation", "DefaultAttributeIndex"]
+
+    deserialized = loader.deserialize(BytesIO(loader.serialize(properties70)), Properties70)
+
+    assert deserialized == properties70
+    assert deserialized.get("Lcl Translation") == (4.0, 5.0, 6.0)
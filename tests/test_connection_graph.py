@@ -0,0 +1,80 @@
+import logging
+from io import BytesIO
+
+import numpy
+
+from test_fbx_file_serializer import build_file, node
+
+from pyfbx import loader, FBXFile, FBXConnection, FBXConnectionGraph, Connections, long
+
+logger = logging.getLogger("tests")
+
+
+def build_graph():
+    # 0 <- 1 <- 2 <- 3, with 4 also parented to 1 and an animated property connection 5 -> 3
+    return FBXConnectionGraph([
+        FBXConnection("OO", 1, 0),
+        FBXConnection("OO", 2, 1),
+        FBXConnection("OO", 3, 2),
+        FBXConnection("OO", 4, 1),
+        FBXConnection("OP", 5, 3, "Lcl Translation"),
+    ])
+
+
+def test_parents_children():
+    graph = build_graph()
+
+    assert graph.parents(2) == [1]
+    assert sorted(graph.children(1)) == [2, 4]
+    assert graph.children(3) == [5]
+    assert graph.children(3, type="OO") == []
+    assert graph.connections_to(3, type="OP")[0].property == "Lcl Translation"
+    assert graph.parents(42) == []
+
+
+def test_transitive_closure():
+    graph = build_graph()
+
+    assert graph.ancestors(3) == [2, 1, 0]
+    assert sorted(graph.descendants(1)) == [2, 3, 4, 5]
+    assert sorted(graph.descendants(1, type="OO")) == [2, 3, 4]
+
+    graph.add(FBXConnection("OO", 0, 3))  # Cycles terminate
+    assert sorted(graph.ancestors(3)) == [0, 1, 2]
+
+
+def test_pairs():
+    graph = build_graph()
+    pairs = graph.pairs()
+
+    assert pairs.dtype == numpy.int64
+    assert pairs.tolist() == [[1, 0], [2, 1], [3, 2], [4, 1], [5, 3]]
+    assert (1, 0) in graph and (0, 1) not in graph
+
+    graph.remove(FBXConnection("OO", 4, 1))
+    assert graph.pairs().shape == (4, 2)
+    assert graph.children(1) == [2]
+
+
+def test_connections_graph():
+    file = loader.deserialize(BytesIO(loader.serialize(build_file())), FBXFile)
+    graph = file.connections.graph()
+
+    assert isinstance(file.connections, Connections)
+    assert graph is file.connections.graph()
+    assert graph.parents(1000) == [2000]
+    assert graph.ancestors(1001) == [2001, 0]
+    assert sorted(graph.children(0)) == [2000, 2001, 2002]
+
+    file.connections.append(node("C", "OO", long(3000), long(2000)))
+
+    assert file.connections.graph() is not graph
+    assert file.connections.graph().children(2000) == [1000, 3000]
+
+
+def test_compact_connections_graph():
+    file = loader.deserialize(BytesIO(loader.serialize(build_file())), FBXFile, compact=True)
+    graph = FBXConnectionGraph.from_node(file.connections)
+
+    assert graph.parents(1002) == [2002]
+    assert len(graph) == 6
@@ -0,0 +1,116 @@
+import io
+import logging
+import os
+import subprocess
+import sys
+
+import pyfbx
+
+from pyfbx import FBXContext, FBXFile, FBXNode, FBXHeaderExtension, default_context
+
+logger = logging.getLogger("tests")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(source: str):
+    return subprocess.run([sys.executable, '-c', source], cwd=ROOT, capture_output=True, text=True)
+
+
+def test_import_is_inert():
+    result = run_python(
+        "import logging, pybran\n"
+        "root = logging.getLogger()\n"
+        "handlers, level = list(root.handlers), root.level\n"
+        "generator = pybran.type_registry.default_value_generator\n"
+        "import sys, pyfbx\n"
+        "lazy = ('pyfbx.context', 'pyfbx.streaming', 'pyfbx.index', 'pyfbx.cache', 'pyfbx.batch', 'pyfbx.metrics',\n"
+        "        'pyfbx.tracing', 'concurrent.futures')\n"
+        "assert not [name for name in lazy if name in sys.modules], [name for name in lazy if name in sys.modules]\n"
+        "import pyfbx.context\n"
+        "assert root.handlers == handlers and root.level == level\n"
+        "assert pybran.type_registry.default_value_generator is generator\n"
+        "assert not pyfbx.context._registries_configured\n"
+        "assert pyfbx.context._default_context is None\n"
+        "from pyfbx import loader\n"
+        "assert pyfbx.context._registries_configured\n"
+        "assert pybran.type_registry.get(b'I') is int\n"
+        "assert loader is pyfbx.loader\n")
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_default_loader():
+    assert pyfbx.loader is default_context().loader
+    assert pyfbx.loader.get_serializer(FBXFile) is default_context().loader.get_serializer(FBXFile)
+
+
+def test_explicit_context():
+    file = FBXFile()
+    file.fbx_header_extension = FBXHeaderExtension()
+    file.fbx_header_extension._name = "FBXHeaderExtension"
+    file.fbx_header_extension._value = []
+    file.fbx_header_extension.fbx_version = 7400
+
+    context = FBXContext()
+    serialized = context.serialize(file)
+
+    assert context.loader is not pyfbx.loader
+    assert serialized == pyfbx.loader.serialize(file)
+    assert isinstance(context.deserialize(io.BytesIO(serialized)), FBXFile)
+
+
+def test_context_serializer_overrides():
+    class CustomSerializer(pyfbx.FBXNodeSerializer):
+        pass
+
+    context = FBXContext({FBXNode: CustomSerializer})
+
+    assert isinstance(context.loader.get_serializer(FBXNode), CustomSerializer)
+    assert not isinstance(pyfbx.loader.get_serializer(FBXNode), CustomSerializer)
+
+
+def test_context_property_serializer_overrides():
+    class UpperStringSerializer(pyfbx.StringSerializer):
+        def deserialize(self, loader, cls, data, **kwargs):
+            return super().deserialize(loader, cls, data, **kwargs).upper()
+
+    file = FBXFile()
+    file.fbx_header_extension = FBXHeaderExtension()
+    file.fbx_header_extension._name = "FBXHeaderExtension"
+    file.fbx_header_extension._value = ["creator"]
+    file.fbx_header_extension.fbx_version = 7400
+
+    serialized = pyfbx.loader.serialize(file)
+    context = FBXContext({str: UpperStringSerializer})
+
+    assert context.deserialize(io.BytesIO(serialized)).fbx_header_extension._value == ["CREATOR"]
+    assert pyfbx.loader.deserialize(io.BytesIO(serialized), FBXFile).fbx_header_extension._value == ["creator"]
+
+    events = []
+
+    class Handler(pyfbx.FBXStreamHandler):
+        def node_start(self, name, properties):
+            events.append(properties)
+
+    pyfbx.FBXStreamParser(context.loader, Handler()).parse(io.BytesIO(serialized))
+    assert ["CREATOR"] in events
+
+    # Registering after a parse replaces the cached decoders
+    context.register(str, pyfbx.StringSerializer)
+    assert context.deserialize(io.BytesIO(serialized)).fbx_header_extension._value == ["creator"]
+
+
+def test_lazy_attributes():
+    assert pyfbx.FBXMetrics is pyfbx.metrics.FBXMetrics
+    assert pyfbx.load_batch is pyfbx.batch.load_batch
+    assert 'FBXParseCache' in dir(pyfbx) and 'loader' in dir(pyfbx)
+
+
+def test_missing_attribute():
+    try:
+        pyfbx.not_an_attribute
+    except AttributeError:
+        pass
+    else:
+        assert False
@@ -0,0 +1,375 @@
+import io
+import logging
+from io import BytesIO
+
+import pytest
+
+from pyfbx import loader, FBXFile, FBXNode, FBXLazyNode, FBXHeaderExtension, GlobalSettings, Objects, Connections, \
+    FBXCompactNode, FBXCompressionPool, FBXSerializationException, DoubleArray, IntArray, FBXArrayEncoding, long, double
+from pyfbx.io import FBXMappedStream
+
+logger = logging.getLogger("tests")
+
+
+def node(name, *values, cls=FBXNode):
+    fbx_node = cls()
+    fbx_node._name = name
+    fbx_node._value = list(values)
+
+    return fbx_node
+
+
+def build_file(models=3):
+    file = FBXFile()
+
+    file.fbx_header_extension = node("FBXHeaderExtension", cls=FBXHeaderExtension)
+    file.fbx_header_extension.fbx_version = 7400
+    file.fbx_header_extension.creator = node("Creator", "pyfbx")
+
+    file.global_settings = node("GlobalSettings", cls=GlobalSettings)
+    file.global_settings.version = node("Version", 1000)
+
+    file.objects = node("Objects", cls=Objects)
+    file.connections = node("Connections", cls=Connections)
+
+    for i in range(models):
+        uid = long(1000 + i)
+
+        geometry = node("Geometry", uid, f"Mesh{i}\x00\x01Geometry", "Mesh")
+        geometry.vertices = node("Vertices", DoubleArray(*[double(v) for v in range(12)],
+                                                         encoding=FBXArrayEncoding.COMPRESSED))
+        geometry.polygon_vertex_index = node("PolygonVertexIndex", IntArray(0, 1, -3, 1, 2, -4))
+
+        model = node("Model", long(2000 + i), f"Model{i}\x00\x01Model", "Mesh")
+        model.version = node("Version", 232)
+
+        file.objects.append(geometry)
+        file.objects.append(model)
+
+        file.connections.append(node("C", "OO", long(1000 + i), long(2000 + i)))
+        file.connections.append(node("C", "OO", long(2000 + i), long(0)))
+
+    return file
+
+
+def test_serialize_deserialize_file():
+    serialized = loader.serialize(build_file())
+    deserialized = loader.deserialize(BytesIO(serialized), FBXFile)
+
+    assert deserialized.global_settings.version._value == [1000]
+    assert len(deserialized.objects) == 6
+    assert deserialized.objects[0].Vertices._value[0] == [double(v) for v in range(12)]
+    assert deserialized.objects[1].Version._value == [232]
+    assert [c._value for c in deserialized.connections][:2] == [["OO", 1000, 2000], ["OO", 2000, 0]]
+
+
+def test_lazy_deserialize_file():
+    serialized = loader.serialize(build_file())
+    eager = loader.deserialize(BytesIO(serialized), FBXFile)
+    lazy = loader.deserialize(BytesIO(serialized), FBXFile, lazy=True)
+
+    assert isinstance(lazy.objects, FBXLazyNode)
+    assert not lazy.objects.loaded
+    assert not lazy.connections.loaded
+
+    assert lazy.global_settings.version._value == eager.global_settings.version._value
+    assert lazy.global_settings.loaded
+    assert not lazy.objects.loaded
+
+    assert [o._value for o in lazy.objects] == [o._value for o in eager.objects]
+    assert lazy.objects.loaded
+
+    lazy.objects.unload()
+    assert not lazy.objects.loaded
+    assert lazy.objects[1].Version._value == [232]
+
+
+def test_lazy_file_reserialize():
+    serialized = loader.serialize(build_file())
+    lazy = loader.deserialize(BytesIO(serialized), FBXFile, lazy=True)
+    lazy.fbx_header_extension.fbx_version = 7400
+
+    assert loader.serialize(lazy) == serialized
+
+
+def test_lazy_node_from_closed_file(tmp_path):
+    path = tmp_path / "lazy.fbx"
+    path.write_bytes(loader.serialize(build_file()))
+
+    lazy = loader.read(str(path), FBXFile, lazy=True)
+
+    assert len(lazy.connections) == 6
+
+
+def test_memory_mapped_file(tmp_path):
+    path = tmp_path / "mapped.fbx"
+    path.write_bytes(loader.serialize(build_file()))
+
+    eager = loader.read(str(path), FBXFile)
+    mapped = loader.read(str(path), FBXFile, memory_map=True, use_numpy=True)
+
+    assert [o._value[:3] for o in mapped.objects] == [o._value[:3] for o in eager.objects]
+
+    indices = mapped.objects[0].PolygonVertexIndex._value[0]
+    assert indices == eager.objects[0].PolygonVertexIndex._value[0]
+    assert not indices.numpy().flags.owndata  # Uncompressed arrays are views into the mapping
+
+
+def test_memory_mapped_lazy_file(tmp_path):
+    path = tmp_path / "mapped_lazy.fbx"
+    path.write_bytes(loader.serialize(build_file()))
+
+    lazy = loader.read(str(path), FBXFile, memory_map=True, lazy=True)
+
+    assert isinstance(lazy.objects, FBXLazyNode)
+    assert len(lazy.objects) == 6
+    assert lazy.connections[0]._value == ["OO", 1000, 2000]
+
+
+def test_mapped_stream(tmp_path):
+    path = tmp_path / "stream.bin"
+    path.write_bytes(b'0123456789')
+
+    with FBXMappedStream.open(str(path)) as stream:
+        assert len(stream) == 10
+        assert stream.read(4) == b'0123'
+        assert isinstance(stream.read(2), memoryview)
+        assert stream.tell() == 6
+
+        stream.seek(-2, io.SEEK_END)
+        assert stream.read() == b'89'
+        assert stream.read(1) == b''
+
+
+def test_mapped_stream_unmappable(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b'')
+
+    with pytest.raises(FBXSerializationException):
+        FBXMappedStream.open(str(path))
+
+    with pytest.raises(FBXSerializationException):
+        FBXMappedStream.from_file(BytesIO(b'data'))
+
+    file = loader.deserialize(BytesIO(loader.serialize(build_file())), FBXFile, memory_map=True)
+    assert len(file.objects) == 6
+
+
+def test_memory_mapped_stream_closed(tmp_path, monkeypatch):
+    path = tmp_path / "closed.fbx"
+    path.write_bytes(loader.serialize(build_file()))
+
+    streams = []
+    from_file = FBXMappedStream.from_file
+    monkeypatch.setattr(FBXMappedStream, 'from_file', lambda file: streams.append(from_file(file)) or streams[-1])
+
+    loader.read(str(path), FBXFile, memory_map=True)
+    lazy = loader.read(str(path), FBXFile, memory_map=True, lazy=True)
+
+    assert streams[0].closed
+    assert not streams[1].closed
+    assert lazy.connections[0]._value == ["OO", 1000, 2000]
+
+
+def test_write_matches_serialize():
+    file = build_file()
+
+    stream = BytesIO()
+    loader.get_serializer(FBXFile).write(loader, file, stream)
+
+    assert stream.getvalue() == loader.serialize(file)
+
+
+def test_write_lazy_file(tmp_path):
+    path = tmp_path / "written.fbx"
+    serialized = loader.serialize(build_file())
+
+    lazy = loader.deserialize(BytesIO(serialized), FBXFile, lazy=True)
+    lazy.fbx_header_extension.fbx_version = 7400
+
+    with open(path, 'wb') as stream:
+        loader.get_serializer(FBXFile).write(loader, lazy, stream)
+
+    assert path.read_bytes() == serialized
+
+
+def test_loader_write(tmp_path, monkeypatch):
+    path = tmp_path / "loader_written.fbx"
+    file = build_file()
+
+    # Written through the streaming path, never serialized as a whole
+    monkeypatch.setattr(type(loader.get_serializer(FBXFile)), 'serialize', None)
+    loader.write(str(path), file)
+    monkeypatch.undo()
+
+    assert path.read_bytes() == loader.serialize(file)
+
+
+def test_parallel_decompression():
+    serialized = loader.serialize(build_file(models=8))
+
+    serial = loader.deserialize(BytesIO(serialized), FBXFile)
+    parallel = loader.deserialize(BytesIO(serialized), FBXFile, decompress_workers=4)
+    parallel_numpy = loader.deserialize(BytesIO(serialized), FBXFile, decompress_workers=4, use_numpy=True)
+
+    for expected, actual, actual_numpy in zip(serial.objects, parallel.objects, parallel_numpy.objects):
+        assert actual._value == expected._value
+
+        if expected._name == "Geometry":
+            assert actual.Vertices._value == expected.Vertices._value
+            assert actual.Vertices._value[0].encoding == FBXArrayEncoding.COMPRESSED
+            assert not actual.Vertices._value[0].wrapped
+            assert actual_numpy.Vertices._value[0].wrapped
+            assert actual_numpy.Vertices._value[0] == expected.Vertices._value[0]
+
+
+def test_parallel_compression():
+    file = build_file(models=8)
+    options = {'compression_level': {DoubleArray: 9}, 'compression_threshold': 32}
+
+    serial = loader.serialize(file, **options)
+    parallel = loader.serialize(file, compress_workers=4, **options)
+
+    assert parallel == serial
+
+    stream = BytesIO()
+    loader.get_serializer(FBXFile).write(loader, file, stream, compress_workers=4, **options)
+
+    assert stream.getvalue() == serial
+    assert loader.deserialize(BytesIO(parallel), FBXFile).objects[0].Vertices._value[0] == [double(v) for v in range(12)]
+
+
+def test_compression_pool_releases_results():
+    file = build_file(models=4)
+    pool = FBXCompressionPool(2, loader.get_serializer(DoubleArray))
+
+    try:
+        pool.submit_tree(loader, file)
+        assert len(pool.pending) == 4
+
+        vertices = file.objects[0].vertices._value[0]
+
+        assert pool.get(vertices) is not None
+        assert pool.get(vertices) is None
+        assert len(pool.pending) == 3
+    finally:
+        pool.shutdown()
+
+
+def test_compact_file():
+    file = build_file()
+    file.fbx_header_extension.fbx_version = node("FBXVersion", 7400)
+
+    serialized = loader.serialize(file)
+
+    eager = loader.deserialize(BytesIO(serialized), FBXFile)
+    compact = loader.deserialize(BytesIO(serialized), FBXFile, compact=True)
+
+    assert isinstance(compact.objects, FBXCompactNode)
+    assert not hasattr(compact.objects, '__dict__')
+    assert compact.objects[0].properties == (1000, "Mesh0\x00\x01Geometry", "Mesh")
+    assert compact.objects[0]["Vertices"].properties[0] == [double(v) for v in range(12)]
+    assert compact.objects[1]["Version"].properties == (232,)
+    assert compact.objects[1]._name is compact.objects[3]._name
+
+    assert loader.serialize(compact) == serialized
+
+    objects = compact.objects.to_node(loader)
+
+    assert isinstance(objects, Objects)
+    assert [o._value for o in objects] == [o._value for o in eager.objects]
+    assert objects[0].Vertices._value == eager.objects[0].Vertices._value
+
+
+def test_compact_lazy_file():
+    serialized = loader.serialize(build_file())
+    lazy = loader.deserialize(BytesIO(serialized), FBXFile, lazy=True, compact=True)
+
+    assert isinstance(lazy.connections.load(), FBXCompactNode)
+    assert lazy.connections[0].properties == ("OO", 1000, 2000)
+
+
+def test_attached_children_are_tracked():
+    deserialized = loader.deserialize(BytesIO(loader.serialize(build_file())), FBXFile)
+
+    assert isinstance(deserialized.global_settings, GlobalSettings)
+    assert 'global_settings' in deserialized.__children__
+    assert 'version' in deserialized.global_settings.__children__
+    assert 'Vertices' in deserialized.objects[0].__children__
+
+
+def test_exclude_nodes():
+    serialized = loader.serialize(build_file())
+
+    deserialized = loader.deserialize(BytesIO(serialized), FBXFile, exclude=["Objects/Geometry/Vertices", "Connections"])
+
+    assert 'connections' not in deserialized.__dict__
+    assert len(deserialized.objects) == 6
+    assert 'Vertices' not in deserialized.objects[0].__dict__
+    assert deserialized.objects[0].PolygonVertexIndex._value[0] == [0, 1, -3, 1, 2, -4]
+
+    by_name = loader.deserialize(BytesIO(serialized), FBXFile, exclude=["Version"])
+
+    assert 'Version' not in by_name.objects[1].__dict__
+    assert 'version' not in by_name.global_settings.__dict__
+
+
+def test_include_nodes():
+    serialized = loader.serialize(build_file())
+
+    deserialized = loader.deserialize(BytesIO(serialized), FBXFile, include=["Objects/Model", "GlobalSettings"])
+
+    assert 'connections' not in deserialized.__dict__
+    assert deserialized.global_settings.version._value == [1000]
+    assert [o._name for o in deserialized.objects] == ["Model"] * 3
+    assert deserialized.objects[0].Version._value == [232]
+
+    lazy = loader.deserialize(BytesIO(serialized), FBXFile, include=["Objects/*"], exclude=["Vertices"], lazy=True)
+
+    assert 'global_settings' not in lazy.__dict__
+    assert len(lazy.objects) == 6
+    assert 'Vertices' not in lazy.objects[0].__dict__
+
+    compact = loader.deserialize(BytesIO(serialized), FBXFile, include=["Objects/Geometry"], compact=True)
+
+    assert [o._name for o in compact.objects] == ["Geometry"] * 3
+    assert compact.objects[0]["Vertices"].properties[0] == [double(v) for v in range(12)]
+
+
+def test_deferred_arrays(tmp_path):
+    path = tmp_path / "deferred.fbx"
+    path.write_bytes(loader.serialize(build_file()))
+
+    eager = loader.read(str(path), FBXFile)
+
+    for options in ({}, {'memory_map': True}):
+        deferred = loader.read(str(path), FBXFile, defer_arrays=True, **options)
+
+        vertices = deferred.objects[0].Vertices._value[0]
+        indices = deferred.objects[0].PolygonVertexIndex._value[0]
+
+        assert vertices.deferred and not vertices.decoded
+        assert len(vertices) == 12 and not vertices.decoded
+        assert vertices.encoding == FBXArrayEncoding.COMPRESSED
+
+        assert vertices[3] == 3.0
+        assert vertices.decoded
+        assert list(indices) == eager.objects[0].PolygonVertexIndex._value[0]
+
+        assert vertices.release()
+        assert not vertices.decoded
+        assert vertices.numpy().tolist() == [float(v) for v in range(12)]
+
+        vertices.append(double(12))
+        assert not vertices.deferred and not vertices.release()
+        assert vertices == [double(v) for v in range(13)]
+
+        assert [o._value for o in deferred.objects][1:] == [o._value for o in eager.objects][1:]
+
+
+def test_deferred_arrays_reserialize():
+    serialized = loader.serialize(build_file())
+    deferred = loader.deserialize(BytesIO(serialized), FBXFile, defer_arrays=True)
+    deferred.fbx_header_extension.fbx_version = 7400
+
+    assert loader.serialize(deferred) == serialized
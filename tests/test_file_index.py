@@ -0,0 +1,86 @@
+import json
+import logging
+import os
+
+from test_fbx_file_serializer import build_file
+
+from pyfbx import loader, FBXFile, FBXFileIndex, FBXIndexEntry, FBXSerializationException
+
+import pytest
+
+logger = logging.getLogger("tests")
+
+
+@pytest.fixture
+def fbx_path(tmp_path):
+    path = tmp_path / "indexed.fbx"
+    path.write_bytes(loader.serialize(build_file()))
+
+    return str(path)
+
+
+def test_build_index(fbx_path):
+    index = FBXFileIndex.build(loader, fbx_path)
+    eager = loader.read(fbx_path, FBXFile)
+
+    assert index.version == 7400
+    assert [entry.name for entry in index] == ["FBXHeaderExtension", "GlobalSettings", "Objects", "Connections"]
+
+    objects = index.find("Objects")
+    assert [child.name for child in objects.children] == ["Geometry", "Model"] * 3
+    assert [child.uid for child in objects.children] == [1000, 2000, 1001, 2001, 1002, 2002]
+    assert all(child.properties == 3 for child in objects.children)
+    assert objects.children[0].start > objects.start and objects.children[-1].end <= objects.end
+
+    assert len(index.find("Connections").children) == len(eager.connections)
+    assert index.find("Connections").children[0].uid is None
+
+
+def test_load_single_nodes(fbx_path):
+    index = FBXFileIndex.build(loader, fbx_path)
+    eager = loader.read(fbx_path, FBXFile)
+
+    model = index.load_object(2001)
+    assert model._value == eager.objects[3]._value
+    assert model.Version._value == [232]
+
+    connections = index.load_section("Connections")
+    assert [c._value for c in connections] == [c._value for c in eager.connections]
+
+    with pytest.raises(FBXSerializationException):
+        index.load_object(42)
+
+
+def test_index_sidecar(fbx_path):
+    index = FBXFileIndex.open(loader, fbx_path, save=True)
+
+    assert os.path.exists(FBXFileIndex.sidecar_path(fbx_path))
+
+    loaded = FBXFileIndex.load(loader, fbx_path)
+    assert loaded.entries == index.entries
+    assert isinstance(loaded.find_object(1000), FBXIndexEntry)
+    assert loaded.load_object(1000)._value[0] == 1000
+
+    with open(fbx_path, 'ab') as file:
+        file.write(b'\x00')
+
+    with pytest.raises(FBXSerializationException):
+        FBXFileIndex.load(loader, fbx_path)
+
+
+
+@pytest.mark.parametrize('fields', [None, {}, {'entries': None}, {'entries': [1], 'version': 7400},
+                                    {'entries': [['Objects', 0, 1]]}])
+def test_index_malformed_sidecar(fbx_path, fields):
+    stat = os.stat(fbx_path)
+    saved = [] if fields is None else {
+        'index_version': FBXFileIndex.INDEX_VERSION, 'size': stat.st_size, 'mtime': stat.st_mtime_ns, **fields
+    }
+
+    with open(FBXFileIndex.sidecar_path(fbx_path), 'w') as file:
+        json.dump(saved, file)
+
+    with pytest.raises(FBXSerializationException):
+        FBXFileIndex.load(loader, fbx_path)
+
+    assert FBXFileIndex.open(loader, fbx_path).entries == FBXFileIndex.build(loader, fbx_path).entries
@@ -1,11 +1,13 @@
 import logging
 import sys
+import zlib
+import numpy
 import pytest
 from io import BytesIO
 
 import pyfbx
 from pyfbx import FBXSerializationException, FBXArray, FloatArray, Properties70, DoubleArray, IntArray, LongArray, \
-    BoolArray, double, long, FBXArrayEncoding
+    BoolArray, FBXNode, double, long, FBXArrayEncoding
 from pyfbx.serializers import ListSerializer
 
 arrays = [
@@ -94,3 +96,141 @@ def test_invalid_list_type():
 
     with pytest.raises(FBXSerializationException):
         list_serializer.serialize(None, [])
+
+
+def test_deserialize_numpy():
+    list_serializer = ListSerializer()
+
+    for template in numeric_arrays + [BoolArray(True, False)]:
+        for encoding in FBXArrayEncoding:
+            array = type(template)(*template, encoding=encoding)
+
+            serialized = list_serializer.serialize(pyfbx.loader, array)
+            deserialized = list_serializer.deserialize(pyfbx.loader, type(array), BytesIO(serialized), use_numpy=True)
+
+            assert isinstance(deserialized, type(array))
+            assert isinstance(deserialized.numpy(), numpy.ndarray)
+            assert deserialized.numpy().dtype == type(array).__dtype__
+            assert deserialized.encoding == encoding
+            assert [round(float(val), 1) for val in deserialized] == array
+
+
+def test_deserialize_numpy_matches_list():
+    list_serializer = ListSerializer()
+
+    array = FloatArray(*[i / 3 for i in range(64)], encoding=FBXArrayEncoding.COMPRESSED)
+    serialized = list_serializer.serialize(pyfbx.loader, array)
+
+    as_list = list_serializer.deserialize(pyfbx.loader, FloatArray, BytesIO(serialized))
+    as_numpy = list_serializer.deserialize(pyfbx.loader, FloatArray, BytesIO(serialized), use_numpy=True)
+
+    assert as_list == as_numpy
+
+
+def test_wrapped_array_mutation():
+    array = IntArray.wrap(numpy.frombuffer(numpy.arange(3, dtype='<i4').tobytes(), dtype='<i4'))
+
+    assert isinstance(array, IntArray) and type(array) is not IntArray
+
+    array.append(3)
+
+    assert type(array) is IntArray  # Plain arrays keep list's native slots
+    assert IntArray.__len__ is list.__len__ and IntArray.__getitem__ is list.__getitem__
+    assert not array.wrapped
+    assert array == [0, 1, 2, 3]
+    assert all(type(val) is int for val in array)
+
+
+def test_wrapped_array_reads():
+    array = IntArray.wrap(numpy.frombuffer(numpy.array([4, 5, 4, 6], dtype='<i4').tobytes(), dtype='<i4'))
+
+    assert array.index(4) == 0
+    assert array.index(4, 1) == 2
+    assert array.index(6, -2) == 3
+    assert array.count(4) == 2
+    assert array.copy() == [4, 5, 4, 6]
+    assert list(reversed(array)) == [6, 4, 5, 4]
+    assert array + [7] == [4, 5, 4, 6, 7]
+    assert array * 2 == [4, 5, 4, 6, 4, 5, 4, 6]
+
+    with pytest.raises(ValueError):
+        array.index(5, 2)
+
+    assert array.wrapped
+
+
+def test_deserialize_numpy_truncated():
+    list_serializer = ListSerializer()
+
+    serialized = list_serializer.serialize(pyfbx.loader, IntArray(1, 2, 3))
+
+    with pytest.raises(FBXSerializationException):
+        list_serializer.deserialize(pyfbx.loader, IntArray, BytesIO(serialized[:-4]), use_numpy=True)
+
+
+def test_serialize_payload_matches_per_element():
+    list_serializer = ListSerializer()
+
+    for template in numeric_arrays + [BoolArray(True, False, True)]:
+        for encoding in FBXArrayEncoding:
+            array = type(template)(*template, encoding=encoding)
+
+            per_element = b''.join(pyfbx.loader.serialize(item) for item in array)
+            if encoding == FBXArrayEncoding.COMPRESSED:
+                per_element = zlib.compress(per_element, level=zlib.Z_DEFAULT_COMPRESSION)
+
+            expected = pyfbx.loader.serialize(len(array)) + pyfbx.loader.serialize(encoding.value) + \
+                pyfbx.loader.serialize(len(per_element)) + per_element
+
+            assert list_serializer.serialize(pyfbx.loader, array) == expected
+
+
+def test_serialize_wrapped_array():
+    list_serializer = ListSerializer()
+
+    array = DoubleArray(*[double(i / 7) for i in range(32)], encoding=FBXArrayEncoding.COMPRESSED)
+    wrapped = DoubleArray.wrap(array.numpy(), encoding=FBXArrayEncoding.COMPRESSED)
+
+    assert list_serializer.serialize(pyfbx.loader, wrapped) == list_serializer.serialize(pyfbx.loader, array)
+    assert pyfbx.loader.serialize(wrapped, ignore_prefix=False) == pyfbx.loader.serialize(array, ignore_prefix=False)
+
+
+def test_array_node_property():
+    fbx_node = FBXNode("Vertices")
+    fbx_node._value = [DoubleArray(double(0.5), double(1.5), encoding=FBXArrayEncoding.COMPRESSED), BoolArray(True)]
+
+    serialized = pyfbx.loader.serialize(fbx_node)
+    deserialized = pyfbx.loader.deserialize(BytesIO(serialized), FBXNode)
+
+    assert deserialized._value == fbx_node._value
+    assert deserialized._value[0].encoding == FBXArrayEncoding.COMPRESSED
+
+
+def test_compression_threshold():
+    list_serializer = ListSerializer()
+
+    small = IntArray(*range(4), encoding=FBXArrayEncoding.COMPRESSED)
+    large = IntArray(*range(256), encoding=FBXArrayEncoding.COMPRESSED)
+
+    serialized_small = list_serializer.serialize(pyfbx.loader, small, compression_threshold=64)
+    serialized_large = list_serializer.serialize(pyfbx.loader, large, compression_threshold=64)
+
+    assert serialized_small == list_serializer.serialize(pyfbx.loader, IntArray(*range(4)))
+
+    deserialized = list_serializer.deserialize(pyfbx.loader, IntArray, BytesIO(serialized_large))
+    assert deserialized == large
+    assert deserialized.encoding == FBXArrayEncoding.COMPRESSED
+
+
+def test_compression_level():
+    list_serializer = ListSerializer()
+
+    array = DoubleArray(*[double(i % 5) for i in range(512)], encoding=FBXArrayEncoding.COMPRESSED)
+    payload = list_serializer.serialize_payload(array)
+
+    fastest = list_serializer.serialize(pyfbx.loader, array, compression_level=1)
+    per_type = list_serializer.serialize(pyfbx.loader, array, compression_level={DoubleArray: 9, IntArray: 1})
+
+    assert fastest.endswith(zlib.compress(payload, level=1))
+    assert per_type.endswith(zlib.compress(payload, level=9))
+    assert list_serializer.deserialize(pyfbx.loader, DoubleArray, BytesIO(per_type)) == array
@@ -0,0 +1,93 @@
+import io
+import json
+import logging
+
+from test_fbx_file_serializer import build_file
+
+from pyfbx import loader, FBXFile, FBXMetrics
+
+logger = logging.getLogger("tests")
+
+
+def test_deserialize_metrics():
+    serialized = loader.serialize(build_file(models=4))
+    metrics = FBXMetrics()
+
+    loader.deserialize(io.BytesIO(serialized), FBXFile, metrics=metrics)
+
+    assert metrics.nodes["Geometry"].count == 4
+    assert metrics.nodes["Model"].count == 4
+    assert metrics.nodes["Vertices"].count == 4
+    assert metrics.nodes["C"].count == 8
+    assert metrics.nodes["Objects"].count == 1
+    assert metrics.nodes["Objects"].bytes > sum(metrics.nodes[name].bytes for name in ("Vertices",))
+    assert metrics.nodes["Objects"].seconds >= metrics.nodes["Geometry"].seconds
+
+    # Geometry and model uids, plus both uids of each connection
+    assert metrics.properties[b'L'].count == 8 + 8 * 2
+    assert metrics.properties[b'L'].bytes == 24 * 9
+    # Geometry and model names and classes, connection types and the creator
+    assert metrics.properties[b'S'].count == 8 * 2 + 8 + 1
+
+    vertices = metrics.properties[b'd']
+    assert vertices.count == 4
+    assert vertices.decompressed_bytes == 4 * 12 * 8
+    assert vertices.compressed_bytes < vertices.decompressed_bytes
+
+    indices = metrics.properties[b'i']
+    assert indices.compressed_bytes == indices.decompressed_bytes == 4 * 6 * 4
+
+
+def test_serialize_metrics_match_deserialize():
+    file = build_file()
+    written, read = FBXMetrics(), FBXMetrics()
+
+    serialized = loader.serialize(file, metrics=written)
+    loader.deserialize(io.BytesIO(serialized), FBXFile, metrics=read)
+
+    for name in ("Objects", "Geometry", "Model", "Vertices", "PolygonVertexIndex", "Connections"):
+        assert written.nodes[name].count == read.nodes[name].count
+        assert written.nodes[name].bytes == read.nodes[name].bytes
+
+    for code in (b'L', b'S', b'd', b'i'):
+        assert written.properties[code].bytes == read.properties[code].bytes
+        assert written.properties[code].compressed_bytes == read.properties[code].compressed_bytes
+
+
+def test_write_metrics():
+    file = build_file()
+    written, streamed = FBXMetrics(), FBXMetrics()
+
+    loader.serialize(file, metrics=written)
+    loader.get_serializer(FBXFile).write(loader, file, io.BytesIO(), metrics=streamed)
+
+    assert {name: entry.bytes for name, entry in streamed.nodes.items()} == \
+           {name: entry.bytes for name, entry in written.nodes.items()}
+
+
+def test_compact_metrics():
+    serialized = loader.serialize(build_file())
+    metrics, compact = FBXMetrics(), FBXMetrics()
+
+    loader.deserialize(io.BytesIO(serialized), FBXFile, metrics=metrics)
+    loader.deserialize(io.BytesIO(serialized), FBXFile, compact=True, metrics=compact)
+
+    assert {name: entry.count for name, entry in compact.nodes.items()} == \
+           {name: entry.count for name, entry in metrics.nodes.items()}
+
+
+def test_metrics_merge_and_json():
+    serialized = loader.serialize(build_file())
+    first, second = FBXMetrics(), FBXMetrics()
+
+    loader.deserialize(io.BytesIO(serialized), FBXFile, metrics=first)
+    loader.deserialize(io.BytesIO(serialized), FBXFile, metrics=second)
+
+    first.merge(second)
+
+    assert first.nodes["Geometry"].count == 6
+    assert json.loads(first.dumps())['properties']['d']['count'] == 6
+    assert "Geometry" in first.summary()
+
+    first.reset()
+    assert not first.nodes and not first.properties
@@ -0,0 +1,72 @@
+import logging
+from io import BytesIO
+
+from test_fbx_file_serializer import build_file, node
+
+from pyfbx import loader, FBXFile, Objects, Object, long
+
+logger = logging.getLogger("tests")
+
+
+def test_objects_lookup():
+    file = loader.deserialize(BytesIO(loader.serialize(build_file())), FBXFile)
+    objects = file.objects
+
+    assert objects.get(1001) is objects[2]
+    assert objects.get(2002)._value[1] == "Model2\x00\x01Model"
+    assert objects.get(42) is None
+
+    assert len(objects.named("Geometry")) == 3
+    assert objects.of_class("Mesh") == list(objects)
+    assert objects.of_class("Light") == []
+
+
+def test_objects_index_consistency():
+    objects = Objects()
+    objects.append(node("Model", long(1), "Cube\x00\x01Model", "Mesh"))
+
+    assert objects.get(1)._name == "Model"
+
+    light = node("NodeAttribute", long(2), "Sun\x00\x01NodeAttribute", "Light")
+    objects.append(light)
+    objects.insert(0, node("Model", long(3), "Lamp\x00\x01Model", "Null"))
+
+    assert objects.get(2) is light
+    assert [o._value[0] for o in objects.named("Model")] == [3, 1]
+
+    objects.append(node("Model", long(5), "Cone\x00\x01Model", "Mesh"))
+    assert [o._value[0] for o in objects.named("Model")] == [3, 1, 5]
+    objects.pop()
+
+    assert objects.of_class("Light") == [light]
+
+    objects.remove(light)
+
+    assert objects.get(2) is None
+    assert objects.of_class("Light") == []
+    assert len(objects.named("NodeAttribute")) == 0
+
+    removed = objects.pop(0)
+    assert objects.get(removed._value[0]) is None
+
+    objects[0] = node("Model", long(4), "Cone\x00\x01Model", "Mesh")
+    assert objects.get(1) is None and objects.get(4) is objects[0]
+
+    objects *= 2
+    assert len(objects.named("Model")) == 2
+
+    objects.clear()
+    assert objects.get(4) is None
+
+
+def test_schema_object_index():
+    obj = Object()
+    obj._name = "Model"
+    obj.uid = long(7)
+    obj.class_ = "Mesh"
+
+    objects = Objects()
+    objects.extend([obj])
+
+    assert objects.get(7) is obj
+    assert objects.of_class("Mesh") == [obj]
@@ -0,0 +1,146 @@
+import logging
+import os
+import pickle
+import stat
+
+from test_fbx_file_serializer import build_file, node
+
+from pyfbx import loader, FBXParseCache, FBXMetrics, DoubleArray, FBXArrayEncoding, double
+
+import pytest
+
+logger = logging.getLogger("tests")
+
+
+@pytest.fixture
+def fbx_path(tmp_path):
+    file = build_file()
+    file.fbx_header_extension.fbx_version = node("FBXVersion", 7400)
+
+    path = tmp_path / "cached.fbx"
+    path.write_bytes(loader.serialize(file))
+
+    return str(path)
+
+
+def test_array_pickle():
+    array = DoubleArray(*[double(i / 3) for i in range(64)], encoding=FBXArrayEncoding.COMPRESSED)
+    wrapped = DoubleArray.wrap(array.numpy())
+
+    restored = pickle.loads(pickle.dumps(array))
+    restored_wrapped = pickle.loads(pickle.dumps(wrapped))
+
+    assert restored == array
+    assert restored.encoding == FBXArrayEncoding.COMPRESSED
+    assert not restored.wrapped
+    assert restored_wrapped.wrapped
+    assert restored_wrapped == array
+
+
+@pytest.mark.parametrize("key", ["stat", "content"])
+def test_parse_cache(tmp_path, fbx_path, key):
+    cache = FBXParseCache(loader, tmp_path / "cache", key=key)
+
+    parsed = cache.read(fbx_path)
+    cached = cache.read(fbx_path)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached is not parsed
+    assert [o._value for o in cached.objects] == [o._value for o in parsed.objects]
+    assert cached.objects[0].Vertices._value == parsed.objects[0].Vertices._value
+    assert loader.serialize(cached) == loader.serialize(parsed)
+
+    # A fresh cache over the same directory loads from the on disk snapshot
+    reopened = FBXParseCache(loader, tmp_path / "cache", key=key)
+    assert reopened.read(fbx_path).connections[0]._value == ["OO", 1000, 2000]
+    assert reopened.hits == 1
+
+
+def test_parse_cache_invalidation(tmp_path, fbx_path):
+    cache = FBXParseCache(loader, tmp_path / "cache")
+    assert len(cache.read(fbx_path).objects) == 6
+
+    with open(fbx_path, 'wb') as file:
+        file.write(loader.serialize(build_file(models=1)))
+
+    os.utime(fbx_path, ns=(0, 1))
+
+    assert len(cache.read(fbx_path).objects) == 2
+    assert cache.misses == 2
+
+
+def test_parse_cache_eviction(tmp_path):
+    paths = []
+
+    for i in range(3):
+        path = tmp_path / f"model{i}.fbx"
+        path.write_bytes(loader.serialize(build_file(models=i + 1)))
+        paths.append(str(path))
+
+    cache = FBXParseCache(loader, tmp_path / "cache")
+    snapshot_size = len(pickle.dumps(cache.read(paths[2])))
+    cache.clear()
+
+    cache = FBXParseCache(loader, tmp_path / "cache", max_disk_bytes=snapshot_size * 2,
+                          max_memory_bytes=snapshot_size * 2)
+
+    for path in paths:
+        cache.read(path)
+
+    assert cache.memory_bytes <= snapshot_size * 2
+    assert len(cache.memory) < 3
+    assert sum(entry.stat().st_size for entry in os.scandir(tmp_path / "cache")
+               if entry.name.endswith(FBXParseCache.SNAPSHOT_EXTENSION)) <= snapshot_size * 2
+    assert cache.read(paths[2]) is not None and cache.hits == 1
+
+
+def test_parse_cache_rejects_tampered_snapshots(tmp_path, fbx_path):
+    cache = FBXParseCache(loader, tmp_path / "cache", secret=b"pipeline")
+    cache.read(fbx_path)
+
+    snapshot_path = next(entry.path for entry in os.scandir(tmp_path / "cache"))
+
+    with open(snapshot_path, 'rb') as file:
+        signed = file.read()
+
+    # A forged payload, it would run code if it were ever unpickled
+    with open(snapshot_path, 'wb') as file:
+        file.write(signed[:32] + pickle.dumps(os.system))
+
+    reopened = FBXParseCache(loader, tmp_path / "cache", secret=b"pipeline")
+    assert len(reopened.read(fbx_path).objects) == 6
+    assert (reopened.hits, reopened.misses) == (0, 1)
+
+    # Restored by the re-parse, and only readable with the same secret
+    assert FBXParseCache(loader, tmp_path / "cache", secret=b"pipeline").read(fbx_path) is not None
+    other = FBXParseCache(loader, tmp_path / "cache", secret=b"other")
+    other.read(fbx_path)
+    assert other.misses == 1
+
+
+def test_parse_cache_persists_its_secret(tmp_path, fbx_path):
+    FBXParseCache(loader, tmp_path / "cache").read(fbx_path)
+
+    secret_path = tmp_path / "cache" / FBXParseCache.SECRET_FILE
+
+    if os.name == 'posix':
+        assert stat.S_IMODE(os.stat(secret_path).st_mode) == 0o600
+
+    # A later run on the same directory reuses the key, and with it the snapshots
+    reopened = FBXParseCache(loader, tmp_path / "cache")
+    assert len(reopened.read(fbx_path).objects) == 6
+    assert (reopened.hits, reopened.misses) == (1, 0)
+    assert reopened.secret == secret_path.read_bytes()
+
+
+def test_parse_cache_key_options(tmp_path, fbx_path):
+    cache = FBXParseCache(loader, tmp_path / "cache")
+
+    assert cache.cache_key(fbx_path, metrics=FBXMetrics()) == cache.cache_key(fbx_path)
+    assert cache.cache_key(fbx_path, decompress_workers=4) == cache.cache_key(fbx_path)
+    assert cache.cache_key(fbx_path, compact=True) != cache.cache_key(fbx_path)
+    assert cache.cache_key(fbx_path, exclude=["Objects"]) != cache.cache_key(fbx_path)
+
+    cache.read(fbx_path, metrics=FBXMetrics())
+    cache.read(fbx_path, metrics=FBXMetrics())
+    assert (cache.hits, cache.misses) == (1, 1)
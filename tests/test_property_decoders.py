@@ -0,0 +1,31 @@
+import logging
+from io import BytesIO
+
+from pyfbx import loader, FBXNode, FloatArray, DoubleArray, IntArray, LongArray, BoolArray, FBXArrayEncoding, long, \
+    double, short
+from pyfbx.serializers import FBXNodeSerializer, property_decoders
+
+logger = logging.getLogger("tests")
+
+values = [
+    short(-3), True, 7, 1.5, double(2.25), long(1 << 40), "string", b'\x00bytes',
+    FloatArray(0.5, 1.5), DoubleArray(double(2.5)), IntArray(-1, 1), LongArray(long(1 << 33)),
+    BoolArray(True, False, encoding=FBXArrayEncoding.COMPRESSED)
+]
+
+
+def test_decoder_per_type_code():
+    assert sorted(property_decoders.keys()) == sorted([b'Y', b'C', b'I', b'F', b'D', b'L', b'S', b'R',
+                                                      b'f', b'd', b'i', b'l', b'b'])
+
+
+def test_deserialize_properties():
+    fbx_node_serializer = FBXNodeSerializer()
+
+    fbx_node = FBXNode("test")
+    fbx_node._value = values
+
+    deserialized = fbx_node_serializer.deserialize(loader, FBXNode, BytesIO(loader.serialize(fbx_node)))
+
+    assert deserialized._value == values
+    assert [type(value) for value in deserialized._value] == [type(value) for value in values]
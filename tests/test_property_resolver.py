@@ -0,0 +1,98 @@
+import logging
+from io import BytesIO
+
+import pytest
+
+from test_fbx_file_serializer import build_file, node
+
+from pyfbx import loader, FBXFile, FBXPropertyResolver, FBXValidationException, Definitions, ObjectType, PropertyTemplate, Properties70, \
+    Property70
+
+logger = logging.getLogger("tests")
+
+
+def serialize_scene():
+    file = build_file()
+
+    template = PropertyTemplate("FbxNode", Properties70(
+        Property70("Visibility", "Visibility", "", "A", 1.0),
+        Property70("Lcl Translation", "Lcl Translation", "", "A", 0.0, 0.0, 0.0)
+    ))
+
+    object_type = node("ObjectType", "Model", cls=ObjectType)
+    object_type.property_template = template
+
+    file.definitions = node("Definitions", cls=Definitions)
+    file.definitions.append(object_type)
+
+    model = file.objects[1]
+    model.properties70 = Properties70(Property70("Lcl Translation", "Lcl Translation", "", "A", 1.0, 2.0, 3.0))
+
+    return loader.serialize(file)
+
+
+def build_scene():
+    return loader.deserialize(BytesIO(serialize_scene()), FBXFile)
+
+
+def test_resolve_effective_properties():
+    file = build_scene()
+    resolver = FBXPropertyResolver.from_file(file)
+
+    model, other_model, geometry = file.objects[1], file.objects[3], file.objects[0]
+
+    assert resolver.resolve(model, "Lcl Translation") == (1.0, 2.0, 3.0)
+    assert resolver.resolve(model, "Visibility") == 1.0
+    assert resolver.resolve(other_model, "Lcl Translation") == (0.0, 0.0, 0.0)
+    assert resolver.resolve(geometry, "Visibility", "missing") == "missing"
+
+    assert dict(resolver.effective(model)) == {"Visibility": 1.0, "Lcl Translation": (1.0, 2.0, 3.0)}
+
+
+def test_resolver_memoization():
+    file = build_scene()
+    resolver = FBXPropertyResolver.from_file(file)
+    model = file.objects[1]
+
+    defaults = resolver.defaults(model)
+    assert resolver.defaults(file.objects[3]) is defaults
+
+    template = file.definitions.object_type("Model").property_template
+    template.properties70.set("Visibility", 0.0)
+
+    assert resolver.defaults(model) is not defaults
+    assert resolver.resolve(model, "Visibility") == 0.0
+
+    model.Properties70.set("Visibility", 0.5)
+    assert resolver.resolve(model, "Visibility") == 0.5
+
+
+def test_resolver_without_definitions():
+    resolver = FBXPropertyResolver.from_file(FBXFile())
+
+    assert resolver.resolve(node("Model"), "Visibility", 1.0) == 1.0
+
+
+def test_resolver_lazy_file():
+    file = loader.deserialize(BytesIO(serialize_scene()), FBXFile, lazy=True)
+    resolver = FBXPropertyResolver.from_file(file)
+
+    assert isinstance(resolver.definitions, Definitions)
+    assert resolver.resolve(file.objects[3], "Lcl Translation") == (0.0, 0.0, 0.0)
+    assert resolver.resolve(file.objects[1], "Lcl Translation") == (1.0, 2.0, 3.0)
+
+
+def test_resolver_compact_definitions():
+    file = loader.deserialize(BytesIO(serialize_scene()), FBXFile, compact=True)
+
+    with pytest.raises(FBXValidationException):
+        FBXPropertyResolver.from_file(file)
+
+    resolver = FBXPropertyResolver.from_file(file, loader)
+
+    assert resolver.resolve(node("Model"), "Visibility") == 1.0
+
+
+def test_resolver_rejects_other_nodes():
+    with pytest.raises(FBXValidationException):
+        FBXPropertyResolver(node("Objects"))
@@ -0,0 +1,65 @@
+import logging
+from io import BytesIO
+
+import numpy
+
+from test_fbx_file_serializer import build_file
+
+from pyfbx import loader, FBXStreamParser, FBXStreamHandler
+
+logger = logging.getLogger("tests")
+
+
+class RecordingHandler(FBXStreamHandler):
+    def __init__(self):
+        super().__init__()
+
+        self.events = []
+
+    def node_start(self, name, properties):
+        self.events.append(("start", name, properties))
+
+    def array(self, name, dtype, payload):
+        self.events.append(("array", name, dtype, payload))
+
+    def node_end(self, name):
+        self.events.append(("end", name))
+
+
+def test_stream_parse_events():
+    handler = RecordingHandler()
+
+    FBXStreamParser(loader, handler).parse(BytesIO(loader.serialize(build_file(models=1))))
+
+    starts = [event[1] for event in handler.events if event[0] == "start"]
+    ends = [event[1] for event in handler.events if event[0] == "end"]
+
+    assert starts == ["FBXHeaderExtension", "Creator", "GlobalSettings", "Version", "Objects", "Geometry", "Vertices",
+                      "PolygonVertexIndex", "Model", "Version", "Connections", "C", "C"]
+    assert sorted(starts) == sorted(ends)
+
+    assert handler.events[0] == ("start", "FBXHeaderExtension", [])
+    assert handler.events[1] == ("start", "Creator", ["pyfbx"])
+    assert handler.events[2] == ("end", "Creator")
+
+
+def test_stream_parse_arrays():
+    handler = RecordingHandler()
+
+    FBXStreamParser(loader, handler).parse(BytesIO(loader.serialize(build_file(models=1))))
+
+    arrays = {event[1]: event for event in handler.events if event[0] == "array"}
+
+    assert arrays["Vertices"][2] == numpy.dtype('<f8')
+    assert arrays["Vertices"][3].tolist() == [float(v) for v in range(12)]
+    assert arrays["PolygonVertexIndex"][3].tolist() == [0, 1, -3, 1, 2, -4]
+
+
+def test_stream_parse_file(tmp_path):
+    path = tmp_path / "stream.fbx"
+    path.write_bytes(loader.serialize(build_file(models=2)))
+
+    handler = RecordingHandler()
+    FBXStreamParser(loader, handler).read(str(path))
+
+    assert len([event for event in handler.events if event[:2] == ("start", "Model")]) == 2
@@ -36,3 +36,14 @@ def test_deserialize_empty_bytes():
 
     with pytest.raises(FBXSerializationException):
         string_serializer.deserialize(None, str, BytesIO(b''))
+
+
+def test_non_ascii_string():
+    string_serializer = StringSerializer()
+
+    test_string = "Modèle\x00\x01Model"
+
+    serialized = string_serializer.serialize(None, test_string)
+    deserialized = string_serializer.deserialize(None, str, BytesIO(serialized))
+
+    assert test_string == deserialized
@@ -0,0 +1,94 @@
+import io
+import json
+import logging
+
+from test_fbx_file_serializer import build_file
+
+from pyfbx import loader, FBXFile, FBXTracer, FBXMetrics
+
+logger = logging.getLogger("tests")
+
+
+def test_deserialize_spans():
+    serialized = loader.serialize(build_file())
+    tracer = FBXTracer()
+
+    loader.deserialize(io.BytesIO(serialized), FBXFile, tracer=tracer)
+
+    names = [event['name'] for event in tracer.events]
+
+    assert names.count("Geometry") == 3
+    assert names.count("Vertices") == 3
+    assert names.count("Objects") == 1
+    assert names.count("C") == 6
+
+    objects = next(event for event in tracer.events if event['name'] == "Objects")
+    geometry = [event for event in tracer.events if event['name'] == "Geometry"]
+
+    assert serialized[objects['args']['offset'] + 25:].startswith(b"Objects")
+    assert objects['args']['offset'] + objects['args']['size'] <= len(serialized)
+
+    # Children are contained in their parent, both in the stream and in time
+    for event in geometry:
+        assert objects['args']['offset'] < event['args']['offset']
+        assert event['args']['offset'] + event['args']['size'] <= objects['args']['offset'] + objects['args']['size']
+        assert objects['ts'] <= event['ts'] and event['ts'] + event['dur'] <= objects['ts'] + objects['dur']
+
+    assert all(event['ph'] == 'X' and event['cat'] == 'deserialize' for event in tracer.events)
+
+
+def test_serialize_spans_match_deserialize():
+    written, read = FBXTracer(), FBXTracer()
+
+    serialized = loader.serialize(build_file(), tracer=written)
+    loader.deserialize(io.BytesIO(serialized), FBXFile, tracer=read)
+
+    def spans(tracer):
+        return sorted((event['name'], event['args']['offset'], event['args']['size']) for event in tracer.events)
+
+    assert spans(written) == spans(read)
+
+    streamed = FBXTracer()
+    loader.get_serializer(FBXFile).write(loader, build_file(), io.BytesIO(), tracer=streamed)
+
+    assert spans(streamed) == spans(read)
+
+
+def test_tracer_with_metrics():
+    serialized = loader.serialize(build_file())
+    tracer, metrics = FBXTracer(), FBXMetrics()
+
+    loader.deserialize(io.BytesIO(serialized), FBXFile, tracer=tracer, metrics=metrics)
+
+    assert len(tracer) == sum(entry.count for entry in metrics.nodes.values())
+
+
+def test_chrome_trace_dump(tmp_path):
+    serialized = loader.serialize(build_file())
+    tracer = FBXTracer(max_events=4)
+
+    loader.deserialize(io.BytesIO(serialized), FBXFile, tracer=tracer)
+
+    path = tmp_path / "trace.json"
+    tracer.dump(str(path))
+
+    trace = json.loads(path.read_text())
+
+    assert len(trace['traceEvents']) == 4
+    assert trace['otherData']['dropped'] == tracer.dropped > 0
+
+
+def test_custom_tracer_hooks():
+    spans = []
+
+    class Recorder(FBXTracer):
+        def begin(self, category, offset):
+            return offset
+
+        def end(self, span, category, name, offset, size):
+            assert span == offset
+            spans.append(name)
+
+    loader.deserialize(io.BytesIO(loader.serialize(build_file())), FBXFile, tracer=Recorder())
+
+    assert spans.count("Geometry") == 3